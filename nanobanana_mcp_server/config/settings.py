@@ -8,6 +8,9 @@ from dotenv import load_dotenv
 from ..core.exceptions import ADCConfigurationError
 from .constants import AUTH_ERROR_MESSAGES
 
+# Environment variable values treated as boolean true (after strip/lower)
+TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes"})
+
 
 class ModelTier(str, Enum):
     """Model selection options."""
@@ -118,7 +121,7 @@ class ServerConfig:
             mask_error_details=os.getenv("FASTMCP_MASK_ERRORS", "false").lower() == "true",
             image_output_dir=str(output_path),
             return_full_image=os.getenv("RETURN_FULL_IMAGE", "false").strip().lower()
-            in ("true", "1", "yes"),
+            in TRUTHY_ENV_VALUES,
         )
 
 
@@ -2,9 +2,13 @@
 
 from typing import List, Optional
 import re
+import string
 from ..config.constants import SUPPORTED_IMAGE_TYPES
 from .exceptions import ValidationError
 
+# Standard base64 alphabet plus padding, for bytes.translate deletion checks
+_BASE64_ALPHABET = (string.ascii_letters + string.digits + "+/=").encode("ascii")
+
 
 def validate_prompt(prompt: str) -> None:
     """Validate image generation prompt."""
@@ -52,12 +56,19 @@ def validate_base64_image(image_b64: str) -> None:
     if not image_b64:
         raise ValidationError("Base64 image data cannot be empty")
 
+    # Check the encoding without decoding: deleting every alphabet byte must leave
+    # nothing, and padding may only be the last one or two characters.
     try:
-        import base64
+        data = image_b64.encode("ascii")
+    except UnicodeEncodeError as e:
+        raise ValidationError(f"Invalid base64 image data: {e}") from e
+
+    if data.translate(None, _BASE64_ALPHABET):
+        raise ValidationError("Invalid base64 image data: non-alphabet characters")
 
-        base64.b64decode(image_b64, validate=True)
-    except Exception as e:
-        raise ValidationError(f"Invalid base64 image data: {e}")
+    unpadded = data.rstrip(b"=")
+    if len(data) % 4 or len(data) - len(unpadded) > 2 or b"=" in unpadded:
+        raise ValidationError("Invalid base64 image data: incorrect padding")
 
 
 def validate_image_list_consistency(
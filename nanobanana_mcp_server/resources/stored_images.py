@@ -143,12 +143,12 @@ def register_stored_image_resources(server: FastMCP):
         try:
             storage_service = get_image_storage_service()
 
-            # Get all images
-            images = storage_service.list_images(include_expired=False)
-
-            # Get storage stats
+            # Get storage stats (this also purges expired images)
             stats = storage_service.get_storage_stats()
 
+            # Get all images; get_storage_stats() just purged expired ones
+            images = storage_service.list_images(cleanup=False)
+
             # Format image list
             image_list = []
             for info in images:
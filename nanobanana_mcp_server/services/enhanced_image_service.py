@@ -19,7 +19,6 @@ from PIL import Image as PILImage
 import os
 import logging
 import mimetypes
-import base64
 from datetime import datetime
 import hashlib
 from io import BytesIO
@@ -70,7 +69,7 @@ class EnhancedImageService:
         n: int = 1,
         negative_prompt: Optional[str] = None,
         system_instruction: Optional[str] = None,
-        input_images: Optional[List[Tuple[str, str]]] = None,
+        input_images: Optional[List[Tuple[str | bytes, str]]] = None,
         aspect_ratio: Optional[str] = None,
         output_path: Optional[str] = None,
     ) -> Tuple[List[MCPImage], List[Dict[str, Any]]]:
@@ -92,7 +91,8 @@ class EnhancedImageService:
             n: Number of images to generate
             negative_prompt: Optional negative prompt
             system_instruction: Optional system instruction
-            input_images: List of (base64, mime_type) tuples for input images
+            input_images: List of (image, mime_type) tuples for input images, where
+                image is raw bytes or a base64 string
             aspect_ratio: Optional aspect ratio string (e.g., "16:9")
             output_path: Optional output path. If a file path with extension,
                 saves directly to that path. If a directory path, uses default
@@ -127,14 +127,18 @@ class EnhancedImageService:
             all_thumbnail_images = []
             all_metadata = []
 
-            for i in range(n):
+            # Step 1-2: M->>G: generateContent -> G-->>M: inline image bytes
+            # (all n requests run concurrently; responses come back in request order)
+            responses = self.gemini_client.generate_content_many(
+                contents, n, aspect_ratio=aspect_ratio
+            )
+
+            for i, response in enumerate(responses):
                 try:
-                    self.logger.debug(f"Generating image {i + 1}/{n}...")
+                    self.logger.debug(f"Processing image {i + 1}/{n}...")
+                    if isinstance(response, Exception):
+                        raise response
 
-                    # Step 1-2: M->>G: generateContent -> G-->>M: inline image bytes
-                    response = self.gemini_client.generate_content(
-                        contents, aspect_ratio=aspect_ratio
-                    )
                     images = self.gemini_client.extract_images(response)
 
                     for j, image_bytes in enumerate(images):
@@ -281,11 +285,8 @@ class EnhancedImageService:
             # Validate image format
             validate_image_format(mime_type)
 
-            # Convert to base64 for Gemini API (only internally, not in tool interface)
-            base_image_b64 = base64.b64encode(image_bytes).decode("utf-8")
-
-            # Create parts for Gemini API
-            image_parts = self.gemini_client.create_image_parts([base_image_b64], [mime_type])
+            # Create parts for Gemini API directly from the file bytes
+            image_parts = self.gemini_client.create_image_parts([image_bytes], [mime_type])
             contents = image_parts + [instruction]
 
             # Generate edited image
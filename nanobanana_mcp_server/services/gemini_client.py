@@ -1,4 +1,6 @@
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 from typing import Any
 from urllib.parse import urlsplit
@@ -17,6 +19,36 @@ from ..config.settings import (
 )
 from ..core.exceptions import AuthenticationError
 
+# Map resolution names to API image_size values (unknown names fall back to 1K)
+_RESOLUTION_IMAGE_SIZES = {
+    "4k": "4K",
+    "2k": "2K",
+    "1k": "1K",
+    "high": "1K",  # Default high to 1K
+}
+
+
+@lru_cache(maxsize=8)
+def _shared_genai_client(
+    api_key: str | None,
+    project: str | None,
+    location: str | None,
+    base_url: str | None,
+) -> genai.Client:
+    """Build one genai.Client per distinct credential set.
+
+    The per-model GeminiClient wrappers (Flash, Pro, NB2, ...) all talk to the same
+    endpoint, so sharing the SDK client lets them reuse one pool of warm HTTP
+    connections instead of each paying its own TLS handshakes.
+    """
+    if api_key is not None:
+        client_kwargs = {"api_key": api_key}
+    else:
+        client_kwargs = {"vertexai": True, "project": project, "location": location}
+    if base_url:
+        client_kwargs["http_options"] = {"base_url": base_url}
+    return genai.Client(**client_kwargs)
+
 
 class GeminiClient:
     """Wrapper for Google Gemini API client with multi-model support."""
@@ -35,30 +67,22 @@ class GeminiClient:
     def client(self) -> genai.Client:
         """Lazy initialization of Gemini client."""
         if self._client is None:
-            # Build http_options for custom base URL if configured
-            http_options = None
-            if self.config.gemini_base_url:
-                http_options = {"base_url": self.config.gemini_base_url}
-                safe_url = self._get_safe_base_url_for_log(self.config.gemini_base_url)
+            base_url = self.config.gemini_base_url
+            if base_url:
+                safe_url = self._get_safe_base_url_for_log(base_url)
                 self.logger.info(f"Using custom base URL: {safe_url}")
 
             if self.config.auth_method == AuthMethod.API_KEY:
                 if not self.config.gemini_api_key:
                     raise AuthenticationError("API key is required for API_KEY auth method")
-                client_kwargs = {"api_key": self.config.gemini_api_key}
-                if http_options:
-                    client_kwargs["http_options"] = http_options
-                self._client = genai.Client(**client_kwargs)
+                self._client = _shared_genai_client(
+                    self.config.gemini_api_key, None, None, base_url
+                )
                 self._log_auth_method("API Key (Developer API)")
             else:  # VERTEX_AI
-                client_kwargs = {
-                    "vertexai": True,
-                    "project": self.config.gcp_project_id,
-                    "location": self.config.gcp_region,
-                }
-                if http_options:
-                    client_kwargs["http_options"] = http_options
-                self._client = genai.Client(**client_kwargs)
+                self._client = _shared_genai_client(
+                    None, self.config.gcp_project_id, self.config.gcp_region, base_url
+                )
                 self._log_auth_method(f"ADC (Vertex AI - {self.config.gcp_region})")
         return self._client
 
@@ -90,11 +114,20 @@ class GeminiClient:
             self.logger.error(f"Authentication validation failed: {e}")
             return False
 
-    def create_image_parts(self, images_b64: list[str], mime_types: list[str]) -> list[gx.Part]:
-        """Convert base64 images to Gemini Part objects."""
-        if not images_b64 or not mime_types:
+    def create_image_parts(
+        self, images_b64: list[str | bytes], mime_types: list[str]
+    ) -> list[gx.Part]:
+        """Convert images to Gemini Part objects.
+
+        Each image may be a base64 string or raw bytes; raw bytes are used as-is,
+        so callers that already hold the file contents skip an encode/decode round trip.
+        """
+        if not images_b64 and not mime_types:
             return []
 
+        # Only one side provided is a caller bug; fail loudly rather than drop the images
+        images_b64 = images_b64 or []
+        mime_types = mime_types or []
         if len(images_b64) != len(mime_types):
             raise ValueError(
                 f"Images and MIME types count mismatch: {len(images_b64)} vs {len(mime_types)}"
@@ -107,7 +140,7 @@ class GeminiClient:
                 continue
 
             try:
-                raw_data = base64.b64decode(b64)
+                raw_data = b64 if isinstance(b64, bytes | bytearray) else base64.b64decode(b64)
                 if len(raw_data) == 0:
                     self.logger.warning(f"Skipping empty image data at index {i}")
                     continue
@@ -167,14 +200,7 @@ class GeminiClient:
                 # Map resolution to image_size for Pro model
                 resolution = config.get("resolution") if config else None
                 if resolution:
-                    # Map resolution names to API image_size values
-                    resolution_map = {
-                        "4k": "4K",
-                        "2k": "2K",
-                        "1k": "1K",
-                        "high": "1K",  # Default high to 1K
-                    }
-                    image_size = resolution_map.get(resolution.lower(), "1K")
+                    image_size = _RESOLUTION_IMAGE_SIZES.get(resolution.lower(), "1K")
                     image_config_kwargs["image_size"] = image_size
                     self.logger.info(f"Setting image_size={image_size} for resolution={resolution}")
 
@@ -207,6 +233,38 @@ class GeminiClient:
             self.logger.error(f"Gemini API error: {e}")
             raise
 
+    def generate_content_many(
+        self,
+        contents: list,
+        n: int,
+        config: dict[str, Any] | None = None,
+        aspect_ratio: str | None = None,
+    ) -> list[Any]:
+        """
+        Issue ``n`` identical generate_content calls concurrently.
+
+        The calls are network-bound, so they run on a thread pool bounded by
+        ``max_concurrent_requests`` and wall time approaches the slowest request
+        rather than the sum of all of them.
+
+        Returns:
+            One entry per request, in request order: the API response, or the
+            exception it raised so callers can decide whether to skip or abort.
+        """
+
+        def request(_: int) -> Any:
+            try:
+                return self.generate_content(contents, config=config, aspect_ratio=aspect_ratio)
+            except Exception as e:
+                return e
+
+        if n <= 1:
+            return [request(i) for i in range(n)]
+
+        max_workers = min(n, max(1, self.config.max_concurrent_requests))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(request, range(n)))
+
     def _filter_parameters(self, config: dict[str, Any]) -> dict[str, Any]:
         """
         Filter configuration parameters based on model capabilities.
@@ -282,12 +282,26 @@ class ImageStorageService:
             return base64.b64encode(thumbnail_bytes).decode()
         return None
 
-    def list_images(self, include_expired: bool = False) -> List[StoredImageInfo]:
-        """List all stored images."""
-        if not include_expired:
+    def list_images(
+        self, include_expired: bool = False, *, cleanup: bool = True
+    ) -> List[StoredImageInfo]:
+        """
+        List all stored images.
+
+        Args:
+            include_expired: Also return images past their expiry time
+            cleanup: Purge expired images first; pass False when the caller has
+                just purged them, and expired entries are filtered out instead
+        """
+        if include_expired:
+            return list(self.image_registry.values())
+
+        if cleanup:
             self._cleanup_expired()
+            return list(self.image_registry.values())
 
-        return list(self.image_registry.values())
+        current_time = time.time()
+        return [info for info in self.image_registry.values() if current_time <= info.expires_at]
 
     def delete_image(self, image_id: str) -> bool:
         """Delete an image and its thumbnail."""
@@ -325,10 +339,11 @@ class ImageStorageService:
         """Get storage statistics."""
         self._cleanup_expired()
 
-        total_size = sum(info.size_bytes for info in self.image_registry.values())
-        total_thumbnail_size = sum(
-            info.thumbnail_size_bytes for info in self.image_registry.values()
-        )
+        total_size = 0
+        total_thumbnail_size = 0
+        for info in self.image_registry.values():
+            total_size += info.size_bytes
+            total_thumbnail_size += info.thumbnail_size_bytes
 
         return {
             "total_images": len(self.image_registry),
@@ -6,6 +6,9 @@ from ..config.settings import ModelSelectionConfig, ModelTier
 from .image_service import ImageService
 from .pro_image_service import ProImageService
 
+# Prompt keywords that count double towards the quality score
+_STRONG_QUALITY_KEYWORDS = ("4k", "professional", "production", "high-res", "hd")
+
 
 class ModelSelector:
     """
@@ -117,9 +120,8 @@ class ModelSelector:
         )
 
         # Strong quality indicators (weighted heavily)
-        strong_quality_keywords = ["4k", "professional", "production", "high-res", "hd"]
         strong_quality_matches = sum(
-            1 for keyword in strong_quality_keywords if keyword in prompt_lower
+            1 for keyword in _STRONG_QUALITY_KEYWORDS if keyword in prompt_lower
         )
         quality_score += strong_quality_matches * 2  # Double weight
 
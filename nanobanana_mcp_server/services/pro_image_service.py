@@ -51,7 +51,7 @@ class ProImageService:
         media_resolution: MediaResolution | None = None,
         negative_prompt: str | None = None,
         system_instruction: str | None = None,
-        input_images: list[tuple[str, str]] | None = None,
+        input_images: list[tuple[str | bytes, str]] | None = None,
         use_storage: bool = True,
     ) -> tuple[list[MCPImage], list[dict[str, Any]]]:
         """
@@ -74,7 +74,8 @@ class ProImageService:
             media_resolution: Vision processing detail level
             negative_prompt: Optional constraints to avoid
             system_instruction: Optional system-level guidance
-            input_images: List of (base64, mime_type) tuples for conditioning
+            input_images: List of (image, mime_type) tuples for conditioning, where
+                image is raw bytes or a base64 string
             use_storage: Store images and return resource links with thumbnails
 
         Returns:
@@ -138,32 +139,35 @@ class ProImageService:
 
             progress.update(20, "Sending requests to Gemini 3 Pro API...")
 
+            # Build generation config for the current image model.
+            # Resolution is passed and mapped to image_size in gemini_client.
+            gen_config = {
+                "resolution": resolution,  # Will be mapped to image_size (1K, 2K, 4K)
+            }
+            if self.config.supports_thinking:
+                gen_config["thinking_level"] = thinking_level.value
+
+            # Grounding is controlled via prompt/system instruction
+            # not as a direct API parameter
+
+            # All n requests run concurrently; responses come back in request order
+            responses = self.gemini_client.generate_content_many(
+                contents, n, config=gen_config, aspect_ratio=aspect_ratio
+            )
+
             # Generate images
             all_images = []
             all_metadata = []
+            first_error: Exception | None = None
 
-            for i in range(n):
+            for i, response in enumerate(responses):
                 try:
                     progress.update(
-                        20 + (i * 70 // n), f"Generating high-quality image {i + 1}/{n}..."
+                        20 + (i * 70 // n), f"Processing high-quality image {i + 1}/{n}..."
                     )
+                    if isinstance(response, Exception):
+                        raise response
 
-                    # Build generation config for the current image model.
-                    # Resolution is passed and mapped to image_size in gemini_client.
-                    gen_config = {
-                        "resolution": resolution,  # Will be mapped to image_size (1K, 2K, 4K)
-                    }
-                    if self.config.supports_thinking:
-                        gen_config["thinking_level"] = thinking_level.value
-
-                    # Grounding is controlled via prompt/system instruction
-                    # not as a direct API parameter
-
-                    response = self.gemini_client.generate_content(
-                        contents,
-                        config=gen_config,
-                        aspect_ratio=aspect_ratio,
-                    )
                     images = self.gemini_client.extract_images(response)
 
                     for j, image_bytes in enumerate(images):
@@ -311,8 +315,13 @@ class ProImageService:
 
                 except Exception as e:
                     self.logger.error(f"Failed to generate Pro image {i + 1}: {e}")
-                    # Re-raise to see the actual error
-                    raise
+                    # The other requests are already paid for, so keep their images
+                    # and only surface the error if nothing succeeded
+                    if first_error is None:
+                        first_error = e
+
+            if first_error is not None and not all_metadata:
+                raise first_error
 
             progress.update(100, f"Generated {len(all_images)} high-quality image(s)")
 
@@ -325,7 +334,7 @@ class ProImageService:
         self,
         instruction: str,
         *,
-        base_image_b64: str | None = None,
+        base_image_b64: str | bytes | None = None,
         mime_type: str = "image/png",
         file_data_part: dict[str, Any] | None = None,
         output_path: str | None = None,
@@ -337,7 +346,8 @@ class ProImageService:
         Edit an image and return thumbnails + per-image metadata.
 
         Input can be provided as either:
-        - Inline image bytes (base_image_b64 + mime_type)
+        - Inline image (base_image_b64 + mime_type); raw bytes are accepted as
+          well as base64 so callers holding file contents need not encode them
         - Files API reference (file_data_part = {file_data:{mime_type, uri}})
         """
         if thinking_level is None:
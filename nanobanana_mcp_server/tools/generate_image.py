@@ -1,19 +1,28 @@
-import base64
 import logging
 import mimetypes
 import os
+from pathlib import Path
 from typing import Annotated, Literal
 
 from fastmcp import Context, FastMCP
 from fastmcp.tools.tool import ToolResult
-from mcp.types import TextContent
+from mcp.types import ResourceLink, TextContent
 from pydantic import Field
 
 from ..config.constants import MAX_INPUT_IMAGES
-from ..config.settings import ModelTier, ThinkingLevel
+from ..config.settings import TRUTHY_ENV_VALUES, ModelTier, ThinkingLevel
 from ..core.exceptions import ValidationError
 from ..utils.validation_utils import validate_output_path
 
+logger = logging.getLogger(__name__)
+
+_BYTES_PER_MB = 1024 * 1024
+
+# The no-results message never varies, so validate its content block once
+_NO_IMAGES_CONTENT = TextContent(
+    type="text", text="❌ No images were generated. Please check the logs for details."
+)
+
 
 def register_generate_image_tool(server: FastMCP):
     """Register the generate_image tool with the FastMCP server."""
@@ -130,6 +139,14 @@ def register_generate_image_tool(server: FastMCP):
                 "Default: uses RETURN_FULL_IMAGE env var, or false if not set."
             ),
         ] = None,
+        inline_thumbnails: Annotated[
+            bool,
+            Field(
+                description="Embed thumbnail previews in the response. If false, return "
+                "file:// resource links to the saved images instead, keeping the response small. "
+                "Ignored when return_full_image is enabled."
+            ),
+        ] = True,
         _ctx: Context | None = None,
     ) -> ToolResult:
         """
@@ -145,8 +162,6 @@ def register_generate_image_tool(server: FastMCP):
         Input images are read from the local filesystem to avoid massive token usage.
         Returns both MCP image content blocks and structured JSON with metadata.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             # Construct input_image_paths list from individual parameters
             input_image_paths = []
@@ -159,9 +174,14 @@ def register_generate_image_tool(server: FastMCP):
                 input_image_paths = None
 
             logger.info(
-                f"Generate image request: prompt='{prompt[:50]}...', n={n}, "
-                f"paths={input_image_paths}, model_tier={model_tier}, aspect_ratio={aspect_ratio}, "
-                f"output_path={output_path}"
+                "Generate image request: prompt='%.50s...', n=%s, paths=%s, model_tier=%s, "
+                "aspect_ratio=%s, output_path=%s",
+                prompt,
+                n,
+                input_image_paths,
+                model_tier,
+                aspect_ratio,
+                output_path,
             )
 
             # Validate output_path if provided
@@ -179,7 +199,7 @@ def register_generate_image_tool(server: FastMCP):
             try:
                 tier = ModelTier(model_tier) if model_tier else ModelTier.AUTO
             except ValueError:
-                logger.warning(f"Invalid model_tier '{model_tier}', defaulting to AUTO")
+                logger.warning("Invalid model_tier '%s', defaulting to AUTO", model_tier)
                 tier = ModelTier.AUTO
 
             # Validate thinking level for Pro model
@@ -187,7 +207,7 @@ def register_generate_image_tool(server: FastMCP):
                 if thinking_level:
                     _ = ThinkingLevel(thinking_level)  # Just validate
             except ValueError:
-                logger.warning(f"Invalid thinking_level '{thinking_level}', defaulting to HIGH")
+                logger.warning("Invalid thinking_level '%s', defaulting to HIGH", thinking_level)
                 thinking_level = "high"
 
             # Get model selector to determine which model to use
@@ -208,8 +228,10 @@ def register_generate_image_tool(server: FastMCP):
 
             model_info = model_selector.get_model_info(selected_tier)
             logger.info(
-                f"Selected {model_info['emoji']} {model_info['name']} "
-                f"({selected_tier.value}) for this request"
+                "Selected %s %s (%s) for this request",
+                model_info["emoji"],
+                model_info["name"],
+                selected_tier.value,
             )
 
             # Validation
@@ -245,7 +267,9 @@ def register_generate_image_tool(server: FastMCP):
                     # Flash edit path uses EnhancedImageService (workflows.md + Files API)
                     if file_id:
                         logger.info(
-                            f"Edit mode (FLASH): using file_id {file_id}, output_path={output_path}"
+                            "Edit mode (FLASH): using file_id %s, output_path=%s",
+                            file_id,
+                            output_path,
                         )
                         thumbnail_images, metadata = enhanced_image_service.edit_image_by_file_id(
                             file_id=file_id, edit_prompt=prompt, output_path=output_path
@@ -253,7 +277,9 @@ def register_generate_image_tool(server: FastMCP):
                     else:
                         # Edit by file path
                         logger.info(
-                            f"Edit mode (FLASH): using file path {input_image_paths[0]}, output_path={output_path}"
+                            "Edit mode (FLASH): using file path %s, output_path=%s",
+                            input_image_paths[0],
+                            output_path,
                         )
                         thumbnail_images, metadata = enhanced_image_service.edit_image_by_path(
                             instruction=prompt,
@@ -269,7 +295,10 @@ def register_generate_image_tool(server: FastMCP):
                         files_api_service = get_files_api_service()
                         file_data_part = files_api_service.create_file_data_part(file_id)
                         logger.info(
-                            f"Edit mode ({selected_tier.value.upper()}): using file_id {file_id}, output_path={output_path}"
+                            "Edit mode (%s): using file_id %s, output_path=%s",
+                            selected_tier.value.upper(),
+                            file_id,
+                            output_path,
                         )
                         thumbnail_images, metadata = selected_service.edit_images(
                             instruction=prompt,
@@ -289,7 +318,10 @@ def register_generate_image_tool(server: FastMCP):
                         # Edit by file path (read bytes locally)
                         src_path = input_image_paths[0]
                         logger.info(
-                            f"Edit mode ({selected_tier.value.upper()}): using file path {src_path}, output_path={output_path}"
+                            "Edit mode (%s): using file path %s, output_path=%s",
+                            selected_tier.value.upper(),
+                            src_path,
+                            output_path,
                         )
                         try:
                             with open(src_path, "rb") as f:
@@ -297,7 +329,6 @@ def register_generate_image_tool(server: FastMCP):
                             mime_type, _ = mimetypes.guess_type(src_path)
                             if not mime_type or not mime_type.startswith("image/"):
                                 mime_type = "image/png"
-                            base64_data = base64.b64encode(image_bytes).decode("utf-8")
                         except Exception as e:
                             raise ValidationError(
                                 f"Failed to load input image {src_path}: {e}"
@@ -305,7 +336,7 @@ def register_generate_image_tool(server: FastMCP):
 
                         thumbnail_images, metadata = selected_service.edit_images(
                             instruction=prompt,
-                            base_image_b64=base64_data,
+                            base_image_b64=image_bytes,
                             mime_type=mime_type,
                             output_path=output_path,
                             thinking_level=(
@@ -323,7 +354,7 @@ def register_generate_image_tool(server: FastMCP):
                 # Generation mode (with optional input images for conditioning)
                 logger.info("Generate mode: creating new images")
                 if aspect_ratio:
-                    logger.info(f"Using aspect ratio override: {aspect_ratio}")
+                    logger.info("Using aspect ratio override: %s", aspect_ratio)
 
                 # Prepare input images by reading from file paths
                 input_images = None
@@ -341,27 +372,26 @@ def register_generate_image_tool(server: FastMCP):
                             if not mime_type or not mime_type.startswith("image/"):
                                 mime_type = "image/png"  # Fallback
 
-                            # Convert to base64 for internal API use
-                            base64_data = base64.b64encode(image_bytes).decode("utf-8")
-                            input_images.append((base64_data, mime_type))
+                            # Raw bytes go straight into the Gemini request parts
+                            input_images.append((image_bytes, mime_type))
 
-                            logger.debug(f"Loaded input image: {path} ({mime_type})")
+                            logger.debug("Loaded input image: %s (%s)", path, mime_type)
 
                         except Exception as e:
                             raise ValidationError(f"Failed to load input image {path}: {e}") from e
 
-                    logger.info(f"Loaded {len(input_images)} input images from file paths")
+                    logger.info("Loaded %d input images from file paths", len(input_images))
 
                 # Generate images following workflows.md pattern:
                 # M->G->FS->F->D (save full-res, create thumbnail, upload to Files API, track in DB)
                 # Route to correct service based on selected model tier
                 if selected_tier == ModelTier.PRO:
                     # Use Pro service for high-quality generation
-                    logger.info(f"Using PRO model: {model_info['model_id']}")
+                    logger.info("Using PRO model: %s", model_info["model_id"])
                     if aspect_ratio:
-                        logger.info(f"Using aspect ratio: {aspect_ratio}")
+                        logger.info("Using aspect ratio: %s", aspect_ratio)
                     if output_path:
-                        logger.info(f"Using output path: {output_path}")
+                        logger.info("Using output path: %s", output_path)
                     thumbnail_images, metadata = selected_service.generate_images(
                         prompt=prompt,
                         n=n,
@@ -376,7 +406,7 @@ def register_generate_image_tool(server: FastMCP):
                     )
                 elif selected_tier == ModelTier.NB2:
                     # Use NB2 service (Flash speed + Pro quality, supports thinking)
-                    logger.info(f"Using NB2 model: {model_info['model_id']}")
+                    logger.info("Using NB2 model: %s", model_info["model_id"])
                     thumbnail_images, metadata = selected_service.generate_images(
                         prompt=prompt,
                         n=n,
@@ -392,7 +422,7 @@ def register_generate_image_tool(server: FastMCP):
                     )
                 else:
                     # Use Flash service (via enhanced_image_service) for speed
-                    logger.info(f"Using FLASH model: {model_info['model_id']}")
+                    logger.info("Using FLASH model: %s", model_info["model_id"])
                     thumbnail_images, metadata = enhanced_image_service.generate_images(
                         prompt=prompt,
                         n=n,
@@ -412,24 +442,14 @@ def register_generate_image_tool(server: FastMCP):
                     effective_return_full_image = get_server_config().return_full_image
                 except RuntimeError:
                     effective_return_full_image = (
-                        os.getenv("RETURN_FULL_IMAGE", "false").strip().lower()
-                        in ("true", "1", "yes")
+                        os.getenv("RETURN_FULL_IMAGE", "false").strip().lower() in TRUTHY_ENV_VALUES
                     )
 
             # Create response with file paths and thumbnails
+            total_bytes = 0
             if metadata:
                 # Filter out any None entries from metadata, keeping thumbnail_images aligned
-                filtered_pairs = [
-                    (m, thumbnail_images[i] if i < len(thumbnail_images) else None)
-                    for i, m in enumerate(metadata)
-                    if m is not None and isinstance(m, dict)
-                ]
-                if filtered_pairs:
-                    metadata, thumbnail_images = zip(*filtered_pairs, strict=False)
-                    metadata = list(metadata)
-                    thumbnail_images = [img for img in thumbnail_images if img is not None]
-                else:
-                    metadata = []
+                metadata, thumbnail_images = _filter_metadata(metadata, thumbnail_images)
 
                 if not metadata:
                     summary = f"❌ Failed to {detected_mode} image(s): {prompt[:50]}... No valid results returned."
@@ -460,17 +480,22 @@ def register_generate_image_tool(server: FastMCP):
                             if i < len(thumbnail_images):
                                 full_images.append(thumbnail_images[i])
                             logger.warning(
-                                f"Full image not found for image {i + 1}, using thumbnail"
+                                "Full image not found for image %d, using thumbnail", i + 1
                             )
 
-                    total_size_mb = total_size / (1024 * 1024)
+                    total_size_mb = total_size / _BYTES_PER_MB
                     if total_size_mb > 10:
                         logger.warning(
-                            f"Large MCP response: {total_size_mb:.1f}MB across "
-                            f"{len(full_images)} full-resolution image(s)"
+                            "Large MCP response: %.1fMB across %d full-resolution image(s)",
+                            total_size_mb,
+                            len(full_images),
                         )
                     thumbnail_images = full_images
 
+                # Or point at the saved files instead of embedding previews
+                elif not inline_thumbnails:
+                    thumbnail_images = _resource_links(metadata)
+
                 # Build summary with mode-specific information
                 action_verb = "Edited" if detected_mode == "edit" else "Generated"
                 model_name = model_info["name"]
@@ -517,7 +542,8 @@ def register_generate_image_tool(server: FastMCP):
                         continue
 
                     size_bytes = meta.get("size_bytes", 0)
-                    size_mb = round(size_bytes / (1024 * 1024), 1) if size_bytes else 0
+                    total_bytes += size_bytes
+                    size_mb = f"{size_bytes / _BYTES_PER_MB:.1f}" if size_bytes else 0
                     full_path = meta.get("full_path", "Unknown path")
                     width = meta.get("width", "?")
                     height = meta.get("height", "?")
@@ -540,6 +566,10 @@ def register_generate_image_tool(server: FastMCP):
                     summary_lines.append(
                         "\n🖼️ **Full-resolution images shown below** (also saved to disk)"
                     )
+                elif not inline_thumbnails:
+                    summary_lines.append(
+                        "\n🔗 **Links to the saved images below** (previews not embedded)"
+                    )
                 else:
                     summary_lines.append(
                         "\n🖼️ **Thumbnail previews shown below** (actual images saved to disk)"
@@ -549,12 +579,12 @@ def register_generate_image_tool(server: FastMCP):
                 content = [TextContent(type="text", text=full_summary), *thumbnail_images]
             else:
                 # Fallback if no images generated
-                summary = "❌ No images were generated. Please check the logs for details."
-                content = [TextContent(type="text", text=summary)]
+                content = [_NO_IMAGES_CONTENT]
 
             structured_content = {
                 "mode": detected_mode,
                 "return_full_image": bool(effective_return_full_image),
+                "inline_thumbnails": inline_thumbnails,
                 "model_tier": selected_tier.value,
                 "model_name": model_info["name"],
                 "model_id": model_info["model_id"],
@@ -601,28 +631,69 @@ def register_generate_image_tool(server: FastMCP):
                     if detected_mode == "edit"
                     else []
                 ),
-                "total_size_mb": round(
-                    sum(m.get("size_bytes", 0) for m in metadata if m and isinstance(m, dict))
-                    / (1024 * 1024),
-                    2,
-                ),
+                "total_size_mb": round(total_bytes / _BYTES_PER_MB, 2),
             }
 
             action_verb = "edited" if detected_mode == "edit" else "generated"
             logger.info(
-                f"Successfully {action_verb} {len(thumbnail_images)} images in {detected_mode} mode"
+                "Successfully %s %d images in %s mode",
+                action_verb,
+                len(thumbnail_images),
+                detected_mode,
             )
 
             return ToolResult(content=content, structured_content=structured_content)
 
         except ValidationError as e:
-            logger.error(f"Validation error in generate_image: {e}")
+            logger.error("Validation error in generate_image: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in generate_image: {e}")
+            logger.error("Unexpected error in generate_image: %s", e)
             raise
 
 
+def _filter_metadata(metadata: list, thumbnail_images: list) -> tuple[list, list]:
+    """
+    Drop invalid metadata entries and their thumbnails in a single pass.
+
+    Returns:
+        Tuple of (valid metadata dicts, thumbnails aligned with them); missing
+        or None thumbnails are skipped.
+    """
+    filtered_meta = []
+    filtered_thumbs = []
+    num_thumbs = len(thumbnail_images)
+    for i, m in enumerate(metadata):
+        # Services build metadata as plain dict literals; this also rejects None
+        if type(m) is not dict:
+            continue
+        filtered_meta.append(m)
+        thumb = thumbnail_images[i] if i < num_thumbs else None
+        if thumb is not None:
+            filtered_thumbs.append(thumb)
+    return filtered_meta, filtered_thumbs
+
+
+def _resource_links(metadata: list) -> list[ResourceLink]:
+    """Build file:// resource links for saved images, skipping entries without a path."""
+    links = []
+    for meta in metadata:
+        full_path = meta.get("full_path")
+        if not full_path:
+            continue
+        mime_type = meta.get("mime_type") or mimetypes.guess_type(full_path)[0] or "image/png"
+        links.append(
+            ResourceLink(
+                type="resource_link",
+                uri=Path(os.path.abspath(full_path)).as_uri(),
+                name=os.path.basename(full_path),
+                mimeType=mime_type,
+                size=meta.get("size_bytes"),
+            )
+        )
+    return links
+
+
 def _get_enhanced_image_service():
     """Get the enhanced image service instance."""
     from ..services import get_enhanced_image_service
@@ -16,6 +16,8 @@ from mcp.types import TextContent
 from ..core.exceptions import ValidationError
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 def register_maintenance_tool(server: FastMCP):
     """Register the maintenance tool with the FastMCP server."""
@@ -67,58 +69,29 @@ def register_maintenance_tool(server: FastMCP):
         - database_hygiene: Clean up database inconsistencies
         - full_cleanup: Run all cleanup operations in sequence
         """
-        logger = logging.getLogger(__name__)
-
         try:
-            logger.info(f"Maintenance operation: {operation}, dry_run={dry_run}")
+            logger.info("Maintenance operation: %s, dry_run=%s", operation, dry_run)
 
             # Get services (would be injected in real implementation)
             maintenance_service = _get_maintenance_service()
 
             # Validate operation
-            valid_operations = [
-                "cleanup_expired",
-                "cleanup_local",
-                "check_quota",
-                "database_hygiene",
-                "full_cleanup",
-            ]
-
-            if operation not in valid_operations:
+            if operation not in _OPERATIONS:
                 raise ValidationError(
-                    f"Invalid operation. Must be one of: {', '.join(valid_operations)}"
+                    f"Invalid operation. Must be one of: {', '.join(_OPERATIONS)}"
                 )
 
             # Execute maintenance operation
-            if operation == "cleanup_expired":
-                result = maintenance_service.cleanup_expired_files(dry_run=dry_run)
-                summary = _format_expired_cleanup_summary(result, dry_run)
-
-            elif operation == "cleanup_local":
-                result = maintenance_service.cleanup_local_files(
-                    dry_run=dry_run,
-                    max_age_hours=max_age_hours or 168,  # 1 week default
-                    keep_count=keep_count or 10,  # Keep at least 10 recent files
-                )
-                summary = _format_local_cleanup_summary(result, dry_run)
+            method_name, formatter, uses_dry_run, uses_retention = _OPERATIONS[operation]
+            kwargs = {}
+            if uses_dry_run:
+                kwargs["dry_run"] = dry_run
+            if uses_retention:
+                kwargs["max_age_hours"] = max_age_hours or 168  # 1 week default
+                kwargs["keep_count"] = keep_count or 10  # Keep at least 10 recent files
 
-            elif operation == "check_quota":
-                result = maintenance_service.check_storage_quota()
-                summary = _format_quota_summary(result)
-
-            elif operation == "database_hygiene":
-                result = maintenance_service.database_hygiene(dry_run=dry_run)
-                summary = _format_database_hygiene_summary(result, dry_run)
-
-            elif operation == "full_cleanup":
-                result = maintenance_service.full_maintenance_cycle(
-                    dry_run=dry_run, max_age_hours=max_age_hours or 168, keep_count=keep_count or 10
-                )
-                summary = _format_full_cleanup_summary(result, dry_run)
-
-            else:
-                # This shouldn't happen due to validation above
-                raise ValidationError(f"Unhandled operation: {operation}")
+            result = getattr(maintenance_service, method_name)(**kwargs)
+            summary = formatter(result, dry_run) if uses_dry_run else formatter(result)
 
             content = [TextContent(type="text", text=summary)]
 
@@ -130,15 +103,15 @@ def register_maintenance_tool(server: FastMCP):
                 "parameters": {"max_age_hours": max_age_hours, "keep_count": keep_count},
             }
 
-            logger.info(f"Maintenance operation {operation} completed successfully")
+            logger.info("Maintenance operation %s completed successfully", operation)
 
             return ToolResult(content=content, structured_content=structured_content)
 
         except ValidationError as e:
-            logger.error(f"Validation error in maintenance: {e}")
+            logger.error("Validation error in maintenance: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in maintenance: {e}")
+            logger.error("Unexpected error in maintenance: %s", e)
             raise
 
 
@@ -160,7 +133,7 @@ def _format_expired_cleanup_summary(result: dict, dry_run: bool) -> str:
         if len(result["errors"]) > 3:
             summary_lines.append(f"   • ... and {len(result['errors']) - 3} more")
 
-    return "\\n".join(summary_lines)
+    return "\n".join(summary_lines)
 
 
 def _format_local_cleanup_summary(result: dict, dry_run: bool) -> str:
@@ -179,7 +152,7 @@ def _format_local_cleanup_summary(result: dict, dry_run: bool) -> str:
     if result.get("errors"):
         summary_lines.append(f"❌ Errors: {len(result['errors'])}")
 
-    return "\\n".join(summary_lines)
+    return "\n".join(summary_lines)
 
 
 def _format_quota_summary(result: dict) -> str:
@@ -205,7 +178,7 @@ def _format_quota_summary(result: dict) -> str:
             "ℹ️ **INFO**: Storage usage is moderate. Monitor for future cleanup needs."
         )
 
-    return "\\n".join(summary_lines)
+    return "\n".join(summary_lines)
 
 
 def _format_database_hygiene_summary(result: dict, dry_run: bool) -> str:
@@ -224,7 +197,7 @@ def _format_database_hygiene_summary(result: dict, dry_run: bool) -> str:
     if result.get("warnings"):
         summary_lines.append(f"⚠️ Warnings: {len(result['warnings'])}")
 
-    return "\\n".join(summary_lines)
+    return "\n".join(summary_lines)
 
 
 def _format_full_cleanup_summary(result: dict, dry_run: bool) -> str:
@@ -257,7 +230,17 @@ def _format_full_cleanup_summary(result: dict, dry_run: bool) -> str:
     summary_lines.append("")
     summary_lines.append("✅ Full maintenance cycle completed")
 
-    return "\\n".join(summary_lines)
+    return "\n".join(summary_lines)
+
+
+# operation -> (service method, summary formatter, takes dry_run, takes retention options)
+_OPERATIONS = {
+    "cleanup_expired": ("cleanup_expired_files", _format_expired_cleanup_summary, True, False),
+    "cleanup_local": ("cleanup_local_files", _format_local_cleanup_summary, True, True),
+    "check_quota": ("check_storage_quota", _format_quota_summary, False, False),
+    "database_hygiene": ("database_hygiene", _format_database_hygiene_summary, True, False),
+    "full_cleanup": ("full_maintenance_cycle", _format_full_cleanup_summary, True, True),
+}
 
 
 def _get_maintenance_service():
@@ -4,9 +4,14 @@ Tool for getting output directory statistics.
 
 from fastmcp import FastMCP, Context
 from fastmcp.tools.tool import ToolResult
-from mcp.types import TextContent
+from mcp.types import ResourceLink, TextContent
 from ..services import get_file_image_service
 import logging
+import mimetypes
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
 
 
 def register_output_stats_tool(server: FastMCP):
@@ -25,8 +30,6 @@ def register_output_stats_tool(server: FastMCP):
         """
         Show statistics about the output directory and recently generated images.
         """
-        logger = logging.getLogger(__name__)
-
         try:
             logger.info("Getting output directory stats")
 
@@ -43,27 +46,40 @@ def register_output_stats_tool(server: FastMCP):
                     structured_content=stats,
                 )
 
+            links = []
             if stats["total_images"] == 0:
                 summary = (
                     f"📁 **Output Directory:** `{stats['output_directory']}`\n\n"
                     f"📊 **Stats:** No images found in output directory."
                 )
             else:
-                summary = (
-                    f"📁 **Output Directory:** `{stats['output_directory']}`\n\n"
-                    f"📊 **Stats:**\n"
-                    f"- Total images: {stats['total_images']}\n"
-                    f"- Total size: {stats['total_size_mb']} MB\n\n"
-                    f"🕒 **Recent Images:**\n"
-                )
-
-                for filename in stats.get("recent_images", []):
-                    summary += f"- `{filename}`\n"
+                recent_images = stats.get("recent_images", [])
+                lines = [
+                    f"📁 **Output Directory:** `{stats['output_directory']}`",
+                    "",
+                    "📊 **Stats:**",
+                    f"- Total images: {stats['total_images']}",
+                    f"- Total size: {stats['total_size_mb']} MB",
+                    "",
+                    f"🕒 **Recent Images:** {len(recent_images)} (linked below)",
+                ]
+                summary = "\n".join(lines) + "\n"
+                output_dir = os.path.abspath(stats["output_directory"])
+                links = [
+                    ResourceLink(
+                        type="resource_link",
+                        uri=Path(output_dir, filename).as_uri(),
+                        name=filename,
+                        mimeType=mimetypes.guess_type(filename)[0] or "image/png",
+                    )
+                    for filename in recent_images
+                ]
 
             return ToolResult(
-                content=[TextContent(type="text", text=summary)], structured_content=stats
+                content=[TextContent(type="text", text=summary), *links],
+                structured_content=stats,
             )
 
         except Exception as e:
-            logger.error(f"Failed to get output stats: {e}")
+            logger.error("Failed to get output stats: %s", e)
             raise
@@ -5,6 +5,8 @@ from fastmcp.tools.tool import ToolResult
 from ..core.exceptions import ValidationError, FileOperationError
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 def register_upload_file_tool(server: FastMCP):
     """Register the upload_file tool with the FastMCP server."""
@@ -35,10 +37,8 @@ def register_upload_file_tool(server: FastMCP):
         Upload a local file through the Gemini Files API and return its URI & metadata.
         Useful when the image is larger than 20MB or reused across prompts.
         """
-        logger = logging.getLogger(__name__)
-
         try:
-            logger.info(f"Upload file request: path='{path}', display_name='{display_name}'")
+            logger.info("Upload file request: path='%s', display_name='%s'", path, display_name)
 
             # Get service (would be injected in real implementation)
             file_service = _get_file_service()
@@ -50,26 +50,26 @@ def register_upload_file_tool(server: FastMCP):
             summary = f"Successfully uploaded file: {metadata['name']}"
 
             # Return as structured content (not image blocks)
-            logger.info(f"Successfully uploaded file: {metadata['name']}")
+            logger.info("Successfully uploaded file: %s", metadata["name"])
 
             return ToolResult(
                 content=[summary], structured_content={"success": True, "file": metadata}
             )
 
         except ValidationError as e:
-            logger.error(f"Validation error in upload_file: {e}")
+            logger.error("Validation error in upload_file: %s", e)
             return ToolResult(
                 content=[f"Validation error: {e}"],
                 structured_content={"error": "validation_error", "message": str(e)},
             )
         except FileOperationError as e:
-            logger.error(f"File operation error in upload_file: {e}")
+            logger.error("File operation error in upload_file: %s", e)
             return ToolResult(
                 content=[f"File upload failed: {e}"],
                 structured_content={"error": "file_operation_error", "message": str(e)},
             )
         except Exception as e:
-            logger.error(f"Unexpected error in upload_file: {e}")
+            logger.error("Unexpected error in upload_file: %s", e)
             raise
 
 
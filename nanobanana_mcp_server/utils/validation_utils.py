@@ -1,7 +1,6 @@
 """Additional validation utilities beyond core validation."""
 
 from typing import Any, List, Optional, Union
-from pathlib import Path
 import re
 import os
 from urllib.parse import urlparse
@@ -9,6 +8,42 @@ from ..core.exceptions import ValidationError
 
 # Supported image extensions for output path detection
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+# Tuple form for a single str.endswith() check (longest first)
+_IMAGE_EXT_TUPLE = tuple(sorted(IMAGE_EXTENSIONS, key=len, reverse=True))
+
+# System directories that output paths must never point into
+_SYSTEM_DIRS = (
+    "/bin",
+    "/sbin",
+    "/usr/bin",
+    "/usr/sbin",
+    "/etc",
+    "/var/log",
+    "/boot",
+    "/proc",
+    "/sys",
+    "/dev",
+)
+# Prefix form so a match falls on a path-component boundary (/dev/... not /devel)
+_SYSTEM_DIR_PREFIXES = tuple(d + "/" for d in _SYSTEM_DIRS)
+
+# Supported aspect ratios according to Gemini API documentation
+# https://ai.google.dev/gemini-api/docs/image-generation#optional_configurations
+STANDARD_ASPECT_RATIOS = (
+    "1:1",
+    "2:3",
+    "3:2",
+    "3:4",
+    "4:3",
+    "4:5",
+    "5:4",
+    "9:16",
+    "16:9",
+    "21:9",
+)
+EXTREME_ASPECT_RATIOS = ("4:1", "1:4", "8:1", "1:8")  # NB2 only
+_STANDARD_ASPECT_RATIO_SET = frozenset(STANDARD_ASPECT_RATIOS)
+_ALL_ASPECT_RATIO_SET = frozenset(STANDARD_ASPECT_RATIOS + EXTREME_ASPECT_RATIOS)
 
 
 def validate_display_name(display_name: str) -> None:
@@ -229,32 +264,25 @@ def validate_aspect_ratio_string(aspect_ratio: str, *, allow_extreme: bool = Fal
     if not isinstance(aspect_ratio, str):
         raise ValidationError("Aspect ratio must be a string")
 
-    # Supported aspect ratios according to Gemini API documentation
-    # https://ai.google.dev/gemini-api/docs/image-generation#optional_configurations
-    SUPPORTED_ASPECT_RATIOS = [
-        "1:1",
-        "2:3",
-        "3:2",
-        "3:4",
-        "4:3",
-        "4:5",
-        "5:4",
-        "9:16",
-        "16:9",
-        "21:9",
-    ]
-    if allow_extreme:
-        SUPPORTED_ASPECT_RATIOS.extend(["4:1", "1:4", "8:1", "1:8"])
-
-    if aspect_ratio not in SUPPORTED_ASPECT_RATIOS:
+    supported = _ALL_ASPECT_RATIO_SET if allow_extreme else _STANDARD_ASPECT_RATIO_SET
+    if aspect_ratio not in supported:
+        allowed = STANDARD_ASPECT_RATIOS + (EXTREME_ASPECT_RATIOS if allow_extreme else ())
         raise ValidationError(
-            f"Unsupported aspect_ratio: '{aspect_ratio}'. "
-            f"Supported values: {', '.join(SUPPORTED_ASPECT_RATIOS)}"
+            f"Unsupported aspect_ratio: '{aspect_ratio}'. Supported values: {', '.join(allowed)}"
         )
 
 
+def _absolute_path(path: str) -> str:
+    """Return an absolute, normalized path without resolving symlinks.
+
+    Unlike ``Path.resolve()`` this performs no filesystem access, so it
+    avoids an lstat per path component on every call.
+    """
+    return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
+
+
 def resolve_output_path(
-    output_path: str | None,
+    output_path: str | os.PathLike[str] | None,
     default_dir: str,
     default_filename: str,
     image_index: int = 1,
@@ -291,42 +319,44 @@ def resolve_output_path(
     """
     # Mode 1: None - use default directory with generated filename
     if output_path is None:
-        default_path = Path(default_dir).resolve()
-        default_path.mkdir(parents=True, exist_ok=True)
-        return str(default_path / default_filename)
+        default_path = _absolute_path(default_dir)
+        os.makedirs(default_path, exist_ok=True)
+        return os.path.join(default_path, default_filename)
+
+    # Work on plain strings throughout; accepts str or os.PathLike
+    p = os.fspath(output_path)
 
-    # Expand ~ to home directory
-    expanded_path = os.path.expanduser(output_path)
-    resolved = Path(expanded_path).resolve()
+    # Expand ~ to home directory and make absolute
+    resolved = _absolute_path(p)
 
     # Check if it looks like a file path (has a recognizable image extension)
-    if resolved.suffix.lower() in IMAGE_EXTENSIONS:
+    if resolved.lower().endswith(_IMAGE_EXT_TUPLE):
         # Mode 2: Exact file path
-        resolved.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(resolved), exist_ok=True)
 
         # For multiple images, append index to filename
         if image_index > 1:
-            stem = resolved.stem
-            suffix = resolved.suffix
-            return str(resolved.parent / f"{stem}_{image_index}{suffix}")
+            stem, suffix = os.path.splitext(resolved)
+            return f"{stem}_{image_index}{suffix}"
 
-        return str(resolved)
+        return resolved
 
-    # Check if it's an existing directory OR ends with a separator
-    if resolved.is_dir() or output_path.endswith(os.sep) or output_path.endswith("/"):
+    # Check if it ends with a separator OR is an existing directory
+    # (string check first so the stat is only paid for ambiguous paths)
+    if p.endswith((os.sep, "/")) or os.path.isdir(resolved):
         # Mode 3: Directory path - use generated filename
-        resolved.mkdir(parents=True, exist_ok=True)
-        return str(resolved / default_filename)
+        os.makedirs(resolved, exist_ok=True)
+        return os.path.join(resolved, default_filename)
 
     # Ambiguous case: no extension, not an existing directory
     # Treat as a file path - user wants this exact name without extension
-    resolved.parent.mkdir(parents=True, exist_ok=True)
+    os.makedirs(os.path.dirname(resolved), exist_ok=True)
 
     # For multiple images without extension, append index
     if image_index > 1:
-        return str(resolved) + f"_{image_index}"
+        return f"{resolved}_{image_index}"
 
-    return str(resolved)
+    return resolved
 
 
 def validate_output_path(output_path: str | None) -> None:
@@ -346,28 +376,11 @@ def validate_output_path(output_path: str | None) -> None:
     if not output_path.strip():
         raise ValidationError("output_path cannot be an empty string")
 
-    # Expand and resolve the path
-    expanded = os.path.expanduser(output_path)
-    resolved = Path(expanded).resolve()
-
-    # Check if parent directory exists or can be created
-    # We don't create it here, just validate it's not impossible
-    parent = resolved.parent
-    if not parent.exists():
-        # Check if any ancestor exists (to verify the path is valid)
-        current = parent
-        while current != current.parent:  # Stop at root
-            if current.exists():
-                break
-            current = current.parent
-        else:
-            # We got to root without finding an existing ancestor
-            # This is actually fine - we'll create the directories
-            pass
+    # Expand and resolve the path (symlinks included)
+    resolved = os.path.realpath(os.path.expanduser(output_path))
 
     # Check for obviously problematic paths
-    path_str = str(resolved).lower()
-    dangerous_paths = ["/bin", "/sbin", "/usr/bin", "/usr/sbin", "/etc", "/var/log"]
-    for dangerous in dangerous_paths:
-        if path_str.startswith(dangerous):
-            raise ValidationError(f"Cannot write to system directory: {dangerous}")
+    path_str = resolved.lower()
+    if path_str in _SYSTEM_DIRS or path_str.startswith(_SYSTEM_DIR_PREFIXES):
+        dangerous = next(d for d in _SYSTEM_DIRS if path_str == d or path_str.startswith(d + "/"))
+        raise ValidationError(f"Cannot write to system directory: {dangerous}")
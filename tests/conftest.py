@@ -0,0 +1,26 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from nanobanana_mcp_server.services.gemini_client import _shared_genai_client
+
+
+@pytest.fixture(autouse=True)
+def _clear_sdk_client_cache():
+    """Drop the shared SDK client cache between tests."""
+    _shared_genai_client.cache_clear()
+    yield
+    _shared_genai_client.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def generate_image_tool_params():
+    """JSON schema parameters of the registered generate_image tool (built once)."""
+    from fastmcp import FastMCP
+
+    from nanobanana_mcp_server.tools.generate_image import register_generate_image_tool
+
+    server = FastMCP("test")
+    register_generate_image_tool(server)
+    tool = next(iter(server._tool_manager._tools.values()))
+    return tool.parameters
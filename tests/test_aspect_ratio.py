@@ -8,6 +8,8 @@ This module tests the aspect ratio feature added in PR #3, including:
 - Edge cases
 """
 
+import logging
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from google.genai import types as gx
@@ -32,6 +34,9 @@ STANDARD_ASPECT_RATIOS = [
 EXTREME_ASPECT_RATIOS = ["4:1", "1:4", "8:1", "1:8"]
 SUPPORTED_ASPECT_RATIOS = STANDARD_ASPECT_RATIOS + EXTREME_ASPECT_RATIOS
 
+# Substring of the warning GeminiClient logs when a custom config overrides aspect_ratio
+CONFIG_CONFLICT_WARNING = "ignoring aspect_ratio"
+
 
 class TestAspectRatioValidation:
     """Test aspect ratio parameter validation."""
@@ -53,44 +58,23 @@ class TestAspectRatioValidation:
 
         validate_aspect_ratio_string(ratio, allow_extreme=True)
 
-    def test_aspect_ratio_literal_type_constraint(self):
+    def test_aspect_ratio_literal_type_constraint(self, generate_image_tool_params):
         """Verify the tool parameter uses Literal type for type safety."""
-        from nanobanana_mcp_server.tools.generate_image import register_generate_image_tool
-        from fastmcp import FastMCP
-        import inspect
-
         # This test ensures the Literal constraint is in place
         # If it's not, the type system won't catch invalid values
-        server = FastMCP("test")
-        register_generate_image_tool(server)
-
-        # Get the generate_image function directly from the module
-        from nanobanana_mcp_server.tools import generate_image as gi_module
-
-        # Find the generate_image function that was decorated
-        generate_image_fn = None
-        for name, obj in inspect.getmembers(gi_module):
-            if name == "register_generate_image_tool":
-                continue
-            if callable(obj) and hasattr(obj, "__wrapped__"):
-                generate_image_fn = obj
-                break
-
-        # If we can't find the decorated function, check the server's registered tools
-        # by examining what register_generate_image_tool registered
-        if generate_image_fn is None:
-            # Just verify the module has the expected structure
-            assert hasattr(gi_module, "register_generate_image_tool")
-            return
-
-        # Check that aspect_ratio parameter exists
-        sig = inspect.signature(generate_image_fn)
-        assert "aspect_ratio" in sig.parameters
+        schema = generate_image_tool_params["properties"]["aspect_ratio"]
+        enums = [option["enum"] for option in schema["anyOf"] if "enum" in option]
+        assert enums == [SUPPORTED_ASPECT_RATIOS]
 
 
 class TestGeminiClientAspectRatio:
     """Test GeminiClient aspect ratio integration."""
 
+    @pytest.fixture(autouse=True)
+    def _warn_level(self, caplog):
+        """Capture warnings for every test in this class."""
+        caplog.set_level(logging.WARNING)
+
     @pytest.fixture
     def mock_config(self):
         """Create mock configuration."""
@@ -140,10 +124,6 @@ class TestGeminiClientAspectRatio:
 
     def test_config_conflict_warning(self, gemini_client, caplog):
         """Test warning when both config dict and aspect_ratio are provided."""
-        import logging
-
-        caplog.set_level(logging.WARNING)
-
         with patch("nanobanana_mcp_server.services.gemini_client.gx") as mock_gx:
             mock_gx.ImageConfig = Mock()
             mock_gx.GenerateContentConfig = Mock()
@@ -158,6 +138,12 @@ class TestGeminiClientAspectRatio:
         # Verify no warning was logged (config dict + aspect_ratio is valid)
         # Warning is only for kwargs['config'] (GenerateContentConfig object)
         # which would override aspect_ratio handling
+        found = False
+        for record in caplog.records:
+            if CONFIG_CONFLICT_WARNING in record.message.lower():
+                found = True
+                break
+        assert not found
 
     def test_response_modalities_set_for_pro_compatibility(self, gemini_client):
         """Test that response_modalities is set to ['TEXT', 'IMAGE'] for Pro model compatibility."""
@@ -175,29 +161,15 @@ class TestGeminiClientAspectRatio:
 class TestAspectRatioMetadata:
     """Test aspect ratio in metadata tracking."""
 
-    def test_aspect_ratio_in_generation_metadata(self):
-        """Test that aspect_ratio appears in generation metadata."""
+    @pytest.mark.parametrize("value", ["16:9", None])
+    def test_aspect_ratio_in_metadata(self, value):
+        """Test that aspect_ratio (including None) is tracked in generation metadata."""
         # This would need integration with actual services
         # For now, verify the metadata structure
-        metadata = {
-            "prompt": "test image",
-            "negative_prompt": None,
-            "system_instruction": None,
-            "aspect_ratio": "16:9",
-        }
+        metadata = {"prompt": "test image", "aspect_ratio": value}
 
         assert "aspect_ratio" in metadata
-        assert metadata["aspect_ratio"] == "16:9"
-
-    def test_aspect_ratio_none_in_metadata(self):
-        """Test that aspect_ratio=None is properly tracked."""
-        metadata = {
-            "prompt": "test image",
-            "aspect_ratio": None,
-        }
-
-        assert "aspect_ratio" in metadata
-        assert metadata["aspect_ratio"] is None
+        assert metadata["aspect_ratio"] == value
 
 
 class TestAspectRatioEdgeCases:
@@ -222,6 +194,8 @@ class TestAspectRatioEdgeCases:
         pass  # Integration test placeholder
 
 
+@pytest.mark.integration
+@pytest.mark.skip(reason="Requires Gemini API access and costs money")
 class TestAspectRatioIntegration:
     """Integration tests for aspect ratio feature.
 
@@ -230,8 +204,6 @@ class TestAspectRatioIntegration:
         pytest -m integration
     """
 
-    @pytest.mark.integration
-    @pytest.mark.skip(reason="Requires Gemini API access and costs money")
     def test_generate_with_16_9_aspect_ratio(self):
         """Integration test: Generate image with 16:9 aspect ratio."""
         # This would test actual API call
@@ -240,10 +212,7 @@ class TestAspectRatioIntegration:
         # assert result is not None
         pass
 
-    @pytest.mark.integration
-    @pytest.mark.skip(reason="Requires Gemini API access and costs money")
-    @pytest.mark.parametrize("ratio", SUPPORTED_ASPECT_RATIOS)
-    def test_all_aspect_ratios_work(self, ratio):
+    def test_all_aspect_ratios_work(self):
         """Integration test: Verify all aspect ratios work with real API."""
         pass
 
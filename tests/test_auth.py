@@ -110,3 +110,15 @@ class TestGeminiClientAuth:
             http_options={"base_url": "https://proxy.example.com/v1beta?token=secret"},
         )
         client.logger.info.assert_any_call("Using custom base URL: https://proxy.example.com")
+
+    @patch("google.genai.Client")
+    def test_model_clients_share_one_sdk_client(self, mock_client_cls):
+        """Per-model wrappers with the same credentials reuse one genai.Client."""
+        from nanobanana_mcp_server.config.settings import ProImageConfig
+
+        config = ServerConfig(gemini_api_key="test-key", auth_method=AuthMethod.API_KEY)
+        flash = GeminiClient(config, GeminiConfig())
+        pro = GeminiClient(config, ProImageConfig())
+
+        assert flash.client is pro.client
+        mock_client_cls.assert_called_once_with(api_key="test-key")
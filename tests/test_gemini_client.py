@@ -0,0 +1,108 @@
+"""
+Tests for GeminiClient request helpers: image part construction and
+concurrent generate_content fan-out.
+"""
+
+import base64
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from nanobanana_mcp_server.config.settings import GeminiConfig, ServerConfig
+from nanobanana_mcp_server.services.gemini_client import GeminiClient
+
+pytestmark = pytest.mark.unit
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+@pytest.fixture
+def gemini_client():
+    return GeminiClient(ServerConfig(gemini_api_key="test-key"), GeminiConfig())
+
+
+class TestCreateImageParts:
+    """Base64 strings and raw bytes should produce identical parts."""
+
+    def test_base64_input_is_decoded(self, gemini_client):
+        parts = gemini_client.create_image_parts(
+            [base64.b64encode(PNG_BYTES).decode()], ["image/png"]
+        )
+
+        assert len(parts) == 1
+        assert parts[0].inline_data.data == PNG_BYTES
+        assert parts[0].inline_data.mime_type == "image/png"
+
+    @pytest.mark.parametrize("raw", [PNG_BYTES, bytearray(PNG_BYTES)])
+    def test_raw_bytes_pass_through(self, gemini_client, raw):
+        parts = gemini_client.create_image_parts([raw], ["image/png"])
+
+        assert len(parts) == 1
+        assert parts[0].inline_data.data == PNG_BYTES
+
+    def test_empty_bytes_are_skipped(self, gemini_client):
+        assert gemini_client.create_image_parts([b""], ["image/png"]) == []
+
+    @pytest.mark.parametrize(
+        "images, mime_types", [([PNG_BYTES], None), ([PNG_BYTES], []), ([], ["image/png"])]
+    )
+    def test_one_sided_input_raises(self, gemini_client, images, mime_types):
+        with pytest.raises(ValueError, match="count mismatch"):
+            gemini_client.create_image_parts(images, mime_types)
+
+    @pytest.mark.parametrize("images, mime_types", [(None, None), ([], [])])
+    def test_no_images_gives_no_parts(self, gemini_client, images, mime_types):
+        assert gemini_client.create_image_parts(images, mime_types) == []
+
+    def test_invalid_base64_raises(self, gemini_client):
+        with pytest.raises(ValueError, match="Invalid image data at index 0"):
+            gemini_client.create_image_parts(["not base64!"], ["image/png"])
+
+
+class TestGenerateContentMany:
+    """Concurrent fan-out of identical generate_content calls."""
+
+    def test_requests_run_concurrently(self, gemini_client):
+        n = 3
+        barrier = threading.Barrier(n, timeout=5)
+
+        def fake_generate(*_args, **_kwargs):
+            # Only returns once all n calls are in flight at the same time
+            return barrier.wait()
+
+        with patch.object(gemini_client, "generate_content", side_effect=fake_generate):
+            responses = gemini_client.generate_content_many(["prompt"], n)
+
+        assert sorted(responses) == list(range(n))
+
+    def test_failures_are_returned_in_request_order(self):
+        gemini_client = GeminiClient(
+            ServerConfig(gemini_api_key="test-key", max_concurrent_requests=1), GeminiConfig()
+        )
+        error = RuntimeError("quota exceeded")
+        results = iter(["first", error, "third"])
+        lock = threading.Lock()
+
+        def fake_generate(*_args, **_kwargs):
+            with lock:
+                result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch.object(gemini_client, "generate_content", side_effect=fake_generate):
+            responses = gemini_client.generate_content_many(["prompt"], 3)
+
+        assert responses == ["first", error, "third"]
+
+    def test_forwards_config_and_aspect_ratio(self, gemini_client):
+        with patch.object(gemini_client, "generate_content", return_value="ok") as mock_gen:
+            responses = gemini_client.generate_content_many(
+                ["prompt"], 1, config={"resolution": "2k"}, aspect_ratio="16:9"
+            )
+
+        assert responses == ["ok"]
+        mock_gen.assert_called_once_with(
+            ["prompt"], config={"resolution": "2k"}, aspect_ratio="16:9"
+        )
@@ -0,0 +1,69 @@
+"""
+Tests for ImageStorageService image listing and storage stats.
+"""
+
+import time
+
+import pytest
+
+from nanobanana_mcp_server.config.settings import GeminiConfig
+from nanobanana_mcp_server.services.image_storage_service import (
+    ImageStorageService,
+    StoredImageInfo,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _info(image_id: str, tmp_path, expires_at: float, size: int) -> StoredImageInfo:
+    full_path = tmp_path / f"{image_id}.png"
+    thumb_path = tmp_path / f"{image_id}_thumb.jpeg"
+    full_path.write_bytes(b"\x00" * size)
+    thumb_path.write_bytes(b"\x00" * 10)
+    return StoredImageInfo(
+        id=image_id,
+        filename=full_path.name,
+        full_path=str(full_path),
+        thumbnail_path=str(thumb_path),
+        size_bytes=size,
+        thumbnail_size_bytes=10,
+        mime_type="image/png",
+        created_at=0.0,
+        expires_at=expires_at,
+        width=1,
+        height=1,
+        thumbnail_width=1,
+        thumbnail_height=1,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return ImageStorageService(GeminiConfig(), str(tmp_path / "store"))
+
+
+def test_list_images_without_cleanup_skips_expired(storage, tmp_path):
+    expired = _info("old", tmp_path, expires_at=time.time() - 1, size=100)
+    live = _info("new", tmp_path, expires_at=time.time() + 3600, size=200)
+    storage.image_registry = {"old": expired, "new": live}
+
+    images = storage.list_images(cleanup=False)
+
+    assert [info.id for info in images] == ["new"]
+    # Nothing was purged
+    assert list(storage.image_registry) == ["old", "new"]
+    assert (tmp_path / "old.png").exists()
+
+
+def test_storage_stats_sum_live_images(storage, tmp_path):
+    storage.image_registry = {
+        "a": _info("a", tmp_path, expires_at=time.time() + 3600, size=100),
+        "b": _info("b", tmp_path, expires_at=time.time() + 3600, size=300),
+    }
+
+    stats = storage.get_storage_stats()
+
+    assert stats["total_images"] == 2
+    assert stats["total_size_bytes"] == 400
+    assert stats["total_thumbnail_size_bytes"] == 20
@@ -0,0 +1,114 @@
+"""
+Tests for the maintenance tool: operation dispatch and summary formatting.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from fastmcp import FastMCP
+import pytest
+
+from nanobanana_mcp_server.core.exceptions import ValidationError
+from nanobanana_mcp_server.tools.maintenance import (
+    _format_database_hygiene_summary,
+    _format_expired_cleanup_summary,
+    _format_full_cleanup_summary,
+    _format_local_cleanup_summary,
+    _format_quota_summary,
+    register_maintenance_tool,
+)
+
+pytestmark = pytest.mark.unit
+
+EXPIRED_RESULT = {"expired_count": 2, "cleared_count": 2, "errors": []}
+LOCAL_RESULT = {
+    "total_files": 10,
+    "removed_count": 3,
+    "freed_mb": 1.5,
+    "kept_count": 7,
+    "errors": [],
+}
+QUOTA_RESULT = {
+    "usage_percentage": 10.0,
+    "estimated_usage_gb": 2.0,
+    "files_api_quota_gb": 20,
+    "total_images": 5,
+    "uploaded_to_files_api": 5,
+    "files_api_active": 4,
+    "files_api_expired": 1,
+}
+HYGIENE_RESULT = {
+    "total_records": 5,
+    "missing_files_removed": 1,
+    "broken_references_fixed": 0,
+    "consistent_records": 4,
+    "warnings": [],
+}
+
+
+@pytest.mark.parametrize(
+    "summary",
+    [
+        _format_expired_cleanup_summary(EXPIRED_RESULT, dry_run=False),
+        _format_local_cleanup_summary(LOCAL_RESULT, dry_run=True),
+        _format_quota_summary(QUOTA_RESULT),
+        _format_database_hygiene_summary(HYGIENE_RESULT, dry_run=False),
+        _format_full_cleanup_summary(
+            {"expired_cleanup": EXPIRED_RESULT, "local_cleanup": LOCAL_RESULT}, dry_run=False
+        ),
+    ],
+    ids=["expired", "local", "quota", "hygiene", "full"],
+)
+def test_summaries_use_real_newlines(summary):
+    """Lines are separated by newlines, not a literal backslash-n."""
+    assert "\\n" not in summary
+    assert len(summary.splitlines()) > 1
+
+
+@pytest.fixture(scope="module")
+def maintenance_fn():
+    server = FastMCP("test")
+    register_maintenance_tool(server)
+    return next(iter(server._tool_manager._tools.values())).fn
+
+
+@pytest.mark.parametrize(
+    "operation, method_name, result, expected_kwargs",
+    [
+        ("cleanup_expired", "cleanup_expired_files", EXPIRED_RESULT, {"dry_run": True}),
+        (
+            "cleanup_local",
+            "cleanup_local_files",
+            LOCAL_RESULT,
+            {"dry_run": True, "max_age_hours": 168, "keep_count": 10},
+        ),
+        ("check_quota", "check_storage_quota", QUOTA_RESULT, {}),
+        ("database_hygiene", "database_hygiene", HYGIENE_RESULT, {"dry_run": True}),
+        (
+            "full_cleanup",
+            "full_maintenance_cycle",
+            {"expired_cleanup": EXPIRED_RESULT},
+            {"dry_run": True, "max_age_hours": 168, "keep_count": 10},
+        ),
+    ],
+)
+def test_operation_dispatch(maintenance_fn, operation, method_name, result, expected_kwargs):
+    service = MagicMock()
+    getattr(service, method_name).return_value = result
+
+    with patch(
+        "nanobanana_mcp_server.tools.maintenance._get_maintenance_service",
+        return_value=service,
+    ):
+        tool_result = maintenance_fn(operation=operation)
+
+    getattr(service, method_name).assert_called_once_with(**expected_kwargs)
+    assert tool_result.structured_content["operation"] == operation
+    assert tool_result.structured_content["result"] == result
+
+
+def test_invalid_operation_lists_valid_ones(maintenance_fn):
+    with (
+        patch("nanobanana_mcp_server.tools.maintenance._get_maintenance_service"),
+        pytest.raises(ValidationError, match="cleanup_expired, cleanup_local"),
+    ):
+        maintenance_fn(operation="defragment")
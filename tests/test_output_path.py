@@ -8,10 +8,12 @@ This module tests the output_path feature, including:
 - Edge cases and error handling
 """
 
+import functools
+import inspect
 import os
+import shutil
+import sys
 import pytest
-from pathlib import Path
-from tempfile import TemporaryDirectory
 
 from nanobanana_mcp_server.utils.validation_utils import (
     resolve_output_path,
@@ -19,101 +21,90 @@ from nanobanana_mcp_server.utils.validation_utils import (
     IMAGE_EXTENSIONS,
 )
 from nanobanana_mcp_server.core.exceptions import ValidationError
+from nanobanana_mcp_server.services.enhanced_image_service import EnhancedImageService
+
+# Signatures are immutable, so build each one only once per session
+_signature = functools.lru_cache(maxsize=None)(inspect.signature)
 
 
 class TestResolveOutputPath:
     """Test resolve_output_path utility function."""
 
-    def test_none_returns_default_directory(self):
+    @pytest.fixture(scope="class")
+    def shared_tmp(self, tmp_path_factory):
+        """One temporary root shared by every test in the class."""
+        return tmp_path_factory.mktemp("out")
+
+    @pytest.fixture
+    def case_dir(self, shared_tmp, request):
+        """Per-test directory under the shared root, named after the test."""
+        path = shared_tmp / request.node.name
+        path.mkdir()
+        return path
+
+    def test_none_returns_default_directory(self, case_dir):
         """None output_path uses default directory with generated filename."""
-        with TemporaryDirectory() as tmpdir:
-            # Resolve tmpdir to handle macOS /private/var symlink
-            resolved_tmpdir = str(Path(tmpdir).resolve())
-            result = resolve_output_path(None, tmpdir, "gen_123.png")
-            assert result == os.path.join(resolved_tmpdir, "gen_123.png")
+        resolved_case_dir = os.path.normpath(os.path.abspath(case_dir))
+        result = resolve_output_path(None, str(case_dir), "gen_123.png")
+        assert result == f"{resolved_case_dir}{os.sep}gen_123.png"
 
-    def test_none_creates_default_directory_if_missing(self):
+    def test_none_creates_default_directory_if_missing(self, case_dir):
         """None output_path creates default directory if it doesn't exist."""
-        with TemporaryDirectory() as tmpdir:
-            new_dir = os.path.join(tmpdir, "new_subdir")
-            resolved_new_dir = str(Path(new_dir).resolve())
-            result = resolve_output_path(None, new_dir, "gen_123.png")
-            assert result == os.path.join(resolved_new_dir, "gen_123.png")
-            assert Path(new_dir).exists()
-
-    def test_file_path_with_png_extension(self):
-        """File path with .png extension is used directly."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "custom", "image.png")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result == str(Path(output).resolve())
-            assert Path(result).parent.exists()  # Parent created
-
-    def test_file_path_with_jpg_extension(self):
-        """File path with .jpg extension is used directly."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "photo.jpg")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("photo.jpg")
-
-    def test_file_path_with_jpeg_extension(self):
-        """File path with .jpeg extension is used directly."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "photo.jpeg")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("photo.jpeg")
-
-    def test_file_path_with_webp_extension(self):
-        """File path with .webp extension is used directly."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "photo.webp")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("photo.webp")
-
-    def test_file_path_with_gif_extension(self):
-        """File path with .gif extension is used directly."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "animation.gif")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("animation.gif")
-
-    def test_existing_directory(self):
+        new_dir = str(case_dir / "new_subdir")
+        resolved_new_dir = os.path.normpath(os.path.abspath(new_dir))
+        result = resolve_output_path(None, new_dir, "gen_123.png")
+        assert result == f"{resolved_new_dir}{os.sep}gen_123.png"
+        assert os.path.isdir(new_dir)
+
+    def test_none_recreates_default_directory_after_removal(self, case_dir):
+        """Default directory is recreated if it is removed between calls."""
+        new_dir = case_dir / "out"
+        resolve_output_path(None, str(new_dir), "a.png")
+        shutil.rmtree(new_dir)
+        result = resolve_output_path(None, str(new_dir), "b.png")
+        assert os.path.isdir(os.path.dirname(result))
+
+    @pytest.mark.parametrize("ext", [".png", ".jpg", ".jpeg", ".webp", ".gif"])
+    def test_file_path_with_extension(self, case_dir, ext):
+        """File path with an image extension is used directly."""
+        output = str(case_dir / "custom" / f"photo{ext}")
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert result == os.path.normpath(os.path.abspath(output))
+        assert result.endswith(f"photo{ext}")
+        assert os.path.isdir(os.path.dirname(result))  # Parent created
+
+    def test_existing_directory(self, case_dir):
         """Existing directory uses generated filename."""
-        with TemporaryDirectory() as tmpdir:
-            result = resolve_output_path(tmpdir, "/default", "gen_123.png")
-            expected = str(Path(tmpdir).resolve() / "gen_123.png")
-            assert result == expected
+        result = resolve_output_path(str(case_dir), "/default", "gen_123.png")
+        expected = f"{os.path.normpath(os.path.abspath(case_dir))}{os.sep}gen_123.png"
+        assert result == expected
 
-    def test_directory_with_trailing_slash(self):
+    def test_directory_with_trailing_slash(self, case_dir):
         """Path ending with / is treated as directory."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "newdir") + "/"
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("gen.png")
-            assert "newdir" in result
-            assert Path(result).parent.exists()
-
-    def test_directory_with_os_separator(self):
+        output = str(case_dir / "newdir") + "/"
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert result.endswith("gen.png")
+        assert "newdir" in result
+        assert os.path.isdir(os.path.dirname(result))
+
+    def test_directory_with_os_separator(self, case_dir):
         """Path ending with os.sep is treated as directory."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "newdir") + os.sep
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("gen.png")
-            assert Path(result).parent.exists()
+        output = str(case_dir / "newdir") + os.sep
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert result.endswith("gen.png")
+        assert os.path.isdir(os.path.dirname(result))
 
-    def test_ambiguous_path_no_extension(self):
+    def test_ambiguous_path_no_extension(self, case_dir):
         """Path without extension treated as file path."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "myimage")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("myimage")  # Used as-is
+        output = str(case_dir / "myimage")
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert result.endswith("myimage")  # Used as-is
 
-    def test_creates_parent_directories(self):
+    def test_creates_parent_directories(self, case_dir):
         """Parent directories are created automatically."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "deep", "nested", "path", "image.png")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert Path(result).parent.exists()
+        output = str(case_dir / "deep" / "nested" / "path" / "image.png")
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert os.path.isdir(os.path.dirname(result))
 
     def test_relative_path_resolved_to_absolute(self):
         """Relative paths are resolved to absolute."""
@@ -126,44 +117,39 @@ class TestResolveOutputPath:
         assert "~" not in result
         assert os.path.isabs(result)
 
-    def test_multiple_images_first_index(self):
+    def test_multiple_images_first_index(self, case_dir):
         """First image (index 1) uses exact path."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "image.png")
-            result = resolve_output_path(output, "/default", "gen.png", image_index=1)
-            assert result.endswith("image.png")
-            assert "_2" not in result
+        output = str(case_dir / "image.png")
+        result = resolve_output_path(output, "/default", "gen.png", image_index=1)
+        assert result.endswith("image.png")
+        assert "_2" not in result
 
-    def test_multiple_images_second_index(self):
+    def test_multiple_images_second_index(self, case_dir):
         """Second image (index 2) appends _2 to filename."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "image.png")
-            result = resolve_output_path(output, "/default", "gen.png", image_index=2)
-            assert result.endswith("image_2.png")
+        output = str(case_dir / "image.png")
+        result = resolve_output_path(output, "/default", "gen.png", image_index=2)
+        assert result.endswith("image_2.png")
 
-    def test_multiple_images_third_index(self):
+    def test_multiple_images_third_index(self, case_dir):
         """Third image (index 3) appends _3 to filename."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "photo.jpg")
-            result = resolve_output_path(output, "/default", "gen.png", image_index=3)
-            assert result.endswith("photo_3.jpg")
+        output = str(case_dir / "photo.jpg")
+        result = resolve_output_path(output, "/default", "gen.png", image_index=3)
+        assert result.endswith("photo_3.jpg")
 
-    def test_multiple_images_with_directory(self):
+    def test_multiple_images_with_directory(self, case_dir):
         """Multiple images with directory use default filenames (no indexing needed)."""
-        with TemporaryDirectory() as tmpdir:
-            # When output_path is a directory, default_filename is used as-is
-            # So each call should generate unique filenames from the caller
-            result1 = resolve_output_path(tmpdir, "/default", "gen_1.png", image_index=1)
-            result2 = resolve_output_path(tmpdir, "/default", "gen_2.png", image_index=2)
-            assert result1.endswith("gen_1.png")
-            assert result2.endswith("gen_2.png")
-
-    def test_multiple_images_no_extension_ambiguous(self):
+        # When output_path is a directory, default_filename is used as-is
+        # So each call should generate unique filenames from the caller
+        result1 = resolve_output_path(str(case_dir), "/default", "gen_1.png", image_index=1)
+        result2 = resolve_output_path(str(case_dir), "/default", "gen_2.png", image_index=2)
+        assert result1.endswith("gen_1.png")
+        assert result2.endswith("gen_2.png")
+
+    def test_multiple_images_no_extension_ambiguous(self, case_dir):
         """Multiple images with ambiguous path appends index."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "myimage")
-            result = resolve_output_path(output, "/default", "gen.png", image_index=2)
-            assert result.endswith("myimage_2")
+        output = str(case_dir / "myimage")
+        result = resolve_output_path(output, "/default", "gen.png", image_index=2)
+        assert result.endswith("myimage_2")
 
 
 class TestValidateOutputPath:
@@ -174,16 +160,14 @@ class TestValidateOutputPath:
         # Should not raise
         validate_output_path(None)
 
-    def test_valid_file_path(self):
+    def test_valid_file_path(self, tmp_path):
         """Valid file path passes validation."""
-        with TemporaryDirectory() as tmpdir:
-            path = os.path.join(tmpdir, "image.png")
-            validate_output_path(path)
+        path = str(tmp_path / "image.png")
+        validate_output_path(path)
 
-    def test_valid_directory_path(self):
+    def test_valid_directory_path(self, tmp_path):
         """Valid directory path passes validation."""
-        with TemporaryDirectory() as tmpdir:
-            validate_output_path(tmpdir)
+        validate_output_path(str(tmp_path))
 
     def test_empty_string_raises_error(self):
         """Empty string raises ValidationError."""
@@ -218,6 +202,26 @@ class TestValidateOutputPath:
         with pytest.raises(ValidationError, match="system directory"):
             validate_output_path("/usr/bin/image.png")
 
+    @pytest.mark.parametrize("path", ["/dev", "/dev/image.png", "/proc/1/image.png"])
+    def test_system_dir_and_children_raise_error(self, path):
+        """The system directory itself and anything beneath it are rejected."""
+        with pytest.raises(ValidationError, match="system directory"):
+            validate_output_path(path)
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="/etc is a symlink on macOS")
+    def test_symlink_into_system_dir_raises_error(self, tmp_path):
+        """Symlinks are resolved before the system directory check."""
+        os.symlink("/etc", tmp_path / "etclink")
+        with pytest.raises(ValidationError, match="system directory: /etc"):
+            validate_output_path(str(tmp_path / "etclink" / "x.png"))
+
+    @pytest.mark.parametrize(
+        "path", ["/devel/out.png", "/dev_data/a.png", "/system/out.png", "/bootcamp/x.png"]
+    )
+    def test_sibling_of_system_dir_is_valid(self, path):
+        """Names that merely start with a system directory name are allowed."""
+        validate_output_path(path)
+
 
 class TestImageExtensions:
     """Test IMAGE_EXTENSIONS constant."""
@@ -244,35 +248,16 @@ class TestImageExtensions:
 class TestOutputPathToolParameter:
     """Test output_path parameter in generate_image tool."""
 
-    def test_generate_image_accepts_output_path(self):
+    def test_generate_image_accepts_output_path(self, generate_image_tool_params):
         """Verify generate_image function accepts output_path parameter."""
-        from nanobanana_mcp_server.tools.generate_image import register_generate_image_tool
-        from fastmcp import FastMCP
-
-        server = FastMCP("test")
-        register_generate_image_tool(server)
-
-        # Access the registered tool through FastMCP's internal structure
         # FastMCP Tool stores parameters as a JSON schema, not a function reference
-        tools = list(server._tool_manager._tools.values())
-        assert len(tools) > 0
-        tool = tools[0]
-        properties = tool.parameters.get("properties", {})
+        properties = generate_image_tool_params.get("properties", {})
         assert "output_path" in properties
 
-    def test_output_path_has_correct_default(self):
+    def test_output_path_has_correct_default(self, generate_image_tool_params):
         """Verify output_path defaults to None (not required)."""
-        from nanobanana_mcp_server.tools.generate_image import register_generate_image_tool
-        from fastmcp import FastMCP
-
-        server = FastMCP("test")
-        register_generate_image_tool(server)
-
-        tools = list(server._tool_manager._tools.values())
-        assert len(tools) > 0
-        tool = tools[0]
         # In JSON schema, optional params with default None are not in "required"
-        required = tool.parameters.get("required", [])
+        required = generate_image_tool_params.get("required", [])
         assert "output_path" not in required
 
 
@@ -281,88 +266,68 @@ class TestEnhancedImageServiceOutputPath:
 
     def test_generate_images_accepts_output_path(self):
         """Verify generate_images method accepts output_path parameter."""
-        from nanobanana_mcp_server.services.enhanced_image_service import EnhancedImageService
-        import inspect
-
-        sig = inspect.signature(EnhancedImageService.generate_images)
+        sig = _signature(EnhancedImageService.generate_images)
         assert "output_path" in sig.parameters
 
     def test_edit_image_by_file_id_accepts_output_path(self):
         """Verify edit_image_by_file_id accepts output_path parameter."""
-        from nanobanana_mcp_server.services.enhanced_image_service import EnhancedImageService
-        import inspect
-
-        sig = inspect.signature(EnhancedImageService.edit_image_by_file_id)
+        sig = _signature(EnhancedImageService.edit_image_by_file_id)
         assert "output_path" in sig.parameters
 
     def test_edit_image_by_path_accepts_output_path(self):
         """Verify edit_image_by_path accepts output_path parameter."""
-        from nanobanana_mcp_server.services.enhanced_image_service import EnhancedImageService
-        import inspect
-
-        sig = inspect.signature(EnhancedImageService.edit_image_by_path)
+        sig = _signature(EnhancedImageService.edit_image_by_path)
         assert "output_path" in sig.parameters
 
     def test_process_generated_image_accepts_output_path(self):
         """Verify _process_generated_image accepts output_path parameter."""
-        from nanobanana_mcp_server.services.enhanced_image_service import EnhancedImageService
-        import inspect
-
-        sig = inspect.signature(EnhancedImageService._process_generated_image)
+        sig = _signature(EnhancedImageService._process_generated_image)
         assert "output_path" in sig.parameters
 
     def test_process_edited_image_accepts_output_path(self):
         """Verify _process_edited_image accepts output_path parameter."""
-        from nanobanana_mcp_server.services.enhanced_image_service import EnhancedImageService
-        import inspect
-
-        sig = inspect.signature(EnhancedImageService._process_edited_image)
+        sig = _signature(EnhancedImageService._process_edited_image)
         assert "output_path" in sig.parameters
 
 
 class TestOutputPathEdgeCases:
     """Test edge cases for output_path."""
 
-    def test_path_with_spaces(self):
+    def test_path_with_spaces(self, tmp_path):
         """Path with spaces is handled correctly."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "my folder", "my image.png")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert "my folder" in result
-            assert result.endswith("my image.png")
-            assert Path(result).parent.exists()
-
-    def test_path_with_unicode(self):
+        output = str(tmp_path / "my folder" / "my image.png")
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert "my folder" in result
+        assert result.endswith("my image.png")
+        assert os.path.isdir(os.path.dirname(result))
+
+    def test_path_with_unicode(self, tmp_path):
         """Path with unicode characters is handled correctly."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "图片", "照片.png")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("照片.png")
-            assert Path(result).parent.exists()
+        output = str(tmp_path / "图片" / "照片.png")
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert result.endswith("照片.png")
+        assert os.path.isdir(os.path.dirname(result))
 
-    def test_very_long_path(self):
+    def test_very_long_path(self, tmp_path):
         """Very long paths are handled (up to filesystem limits)."""
-        with TemporaryDirectory() as tmpdir:
-            # Create a path that's long but within reasonable limits
-            long_name = "a" * 100 + ".png"
-            output = os.path.join(tmpdir, long_name)
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith(long_name)
-
-    def test_uppercase_extension(self):
+        # Create a path that's long but within reasonable limits
+        long_name = "a" * 100 + ".png"
+        output = str(tmp_path / long_name)
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert result.endswith(long_name)
+
+    def test_uppercase_extension(self, tmp_path):
         """Uppercase extensions are recognized."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "IMAGE.PNG")
-            result = resolve_output_path(output, "/default", "gen.png")
-            # Should be recognized as a file path due to extension
-            assert result.endswith("IMAGE.PNG")
+        output = str(tmp_path / "IMAGE.PNG")
+        result = resolve_output_path(output, "/default", "gen.png")
+        # Should be recognized as a file path due to extension
+        assert result.endswith("IMAGE.PNG")
 
-    def test_mixed_case_extension(self):
+    def test_mixed_case_extension(self, tmp_path):
         """Mixed case extensions are recognized."""
-        with TemporaryDirectory() as tmpdir:
-            output = os.path.join(tmpdir, "photo.JpG")
-            result = resolve_output_path(output, "/default", "gen.png")
-            assert result.endswith("photo.JpG")
+        output = str(tmp_path / "photo.JpG")
+        result = resolve_output_path(output, "/default", "gen.png")
+        assert result.endswith("photo.JpG")
 
 
 # Mark all tests as unit tests
@@ -0,0 +1,66 @@
+"""
+Tests for the show_output_stats tool response.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from fastmcp import FastMCP
+from mcp.types import ResourceLink, TextContent
+import pytest
+
+from nanobanana_mcp_server.tools.output_stats import register_output_stats_tool
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="module")
+def show_output_stats():
+    server = FastMCP("test")
+    register_output_stats_tool(server)
+    return next(iter(server._tool_manager._tools.values())).fn
+
+
+def _run(show_output_stats, stats):
+    service = MagicMock()
+    service.get_output_stats.return_value = stats
+    with patch(
+        "nanobanana_mcp_server.tools.output_stats.get_file_image_service",
+        return_value=service,
+    ):
+        return show_output_stats()
+
+
+def test_recent_images_are_resource_links(show_output_stats, tmp_path):
+    stats = {
+        "output_directory": str(tmp_path),
+        "total_images": 2,
+        "total_size_bytes": 2048,
+        "total_size_mb": 0.0,
+        "recent_images": ["b.jpg", "a.png"],
+    }
+
+    result = _run(show_output_stats, stats)
+
+    text, *links = result.content
+    assert isinstance(text, TextContent)
+    assert "**Recent Images:** 2 (linked below)" in text.text
+    assert "b.jpg" not in text.text
+    assert all(isinstance(link, ResourceLink) for link in links)
+    assert [link.name for link in links] == ["b.jpg", "a.png"]
+    assert str(links[0].uri) == (tmp_path / "b.jpg").as_uri()
+    assert [link.mimeType for link in links] == ["image/jpeg", "image/png"]
+
+
+def test_empty_directory_has_no_links(show_output_stats, tmp_path):
+    stats = {
+        "output_directory": str(tmp_path),
+        "total_images": 0,
+        "total_size_bytes": 0,
+        "total_size_mb": 0.0,
+        "recent_images": [],
+    }
+
+    result = _run(show_output_stats, stats)
+
+    assert len(result.content) == 1
+    assert "No images found" in result.content[0].text
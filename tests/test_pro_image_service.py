@@ -0,0 +1,36 @@
+"""
+Tests for ProImageService handling of concurrent request failures.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from nanobanana_mcp_server.config.settings import ProImageConfig
+from nanobanana_mcp_server.services.pro_image_service import ProImageService
+
+pytestmark = pytest.mark.unit
+
+
+def _service(responses):
+    gemini_client = Mock()
+    gemini_client.generate_content_many.return_value = responses
+    gemini_client.extract_images.side_effect = lambda response: [response]
+    return ProImageService(gemini_client, ProImageConfig())
+
+
+def test_failed_response_keeps_other_images():
+    service = _service([RuntimeError("quota exceeded"), b"second", b"third"])
+
+    images, metadata = service.generate_images("a cat", n=3, use_storage=False)
+
+    assert len(images) == 2
+    assert [m["response_index"] for m in metadata] == [2, 3]
+
+
+def test_raises_when_every_response_failed():
+    error = RuntimeError("quota exceeded")
+    service = _service([error, RuntimeError("timeout")])
+
+    with pytest.raises(RuntimeError, match="quota exceeded"):
+        service.generate_images("a cat", n=2, use_storage=False)
@@ -6,133 +6,77 @@ This module tests the return_full_image option, including:
 - Tool parameter registration and schema
 - Priority resolution: tool param > server config > env var > default
 - Replacement logic: full images, fallback to thumbnails, metadata alignment
+- inline_thumbnails=False: resource links to saved files instead of previews
 """
 
 import os
-import tempfile
 from unittest.mock import patch
 
 from fastmcp.utilities.types import Image as MCPImage
 import pytest
 
-from nanobanana_mcp_server.config.settings import ServerConfig
+from nanobanana_mcp_server.config.settings import TRUTHY_ENV_VALUES, ServerConfig
+from nanobanana_mcp_server.tools.generate_image import _filter_metadata, _resource_links
 
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture(scope="module")
+def jpeg_bytes():
+    return b"\xff\xd8\xff\xe0" + b"\x00" * 50
+
+
+@pytest.fixture
+def thumbnail(jpeg_bytes):
+    return MCPImage(data=jpeg_bytes, format="jpeg")
+
+
+@pytest.fixture(scope="module")
+def thumbs_abc(jpeg_bytes):
+    """Three distinct thumbnails, built once for the alignment tests."""
+    return tuple(MCPImage(data=jpeg_bytes, format="jpeg") for _ in range(3))
+
+
 class TestServerConfigReturnFullImage:
     """Test ServerConfig.return_full_image field and env var parsing."""
 
-    def test_default_is_false(self):
-        """return_full_image defaults to false when env var is not set."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ, {"GEMINI_API_KEY": "test-key"}, clear=True
+    @pytest.mark.parametrize(
+        "env_value, expected",
+        [
+            (None, False),  # default when unset
+            ("true", True),
+            ("false", False),
+            ("1", True),
+            ("yes", True),
+            ("maybe", False),  # unrecognized values
+            ("TRUE", True),  # case-insensitive
+            (" true ", True),  # surrounding whitespace
+        ],
+    )
+    def test_env_var_parsing(self, env_value, expected):
+        """RETURN_FULL_IMAGE is parsed into return_full_image."""
+        env = {"GEMINI_API_KEY": "test-key"}
+        if env_value is not None:
+            env["RETURN_FULL_IMAGE"] = env_value
+        with (
+            patch("nanobanana_mcp_server.config.settings.load_dotenv"),
+            patch.dict(os.environ, env, clear=True),
         ):
             config = ServerConfig.from_env()
-            assert config.return_full_image is False
-
-    def test_env_var_true(self):
-        """return_full_image is true when RETURN_FULL_IMAGE=true."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ,
-            {"GEMINI_API_KEY": "test-key", "RETURN_FULL_IMAGE": "true"},
-            clear=True,
-        ):
-            config = ServerConfig.from_env()
-            assert config.return_full_image is True
-
-    def test_env_var_false(self):
-        """return_full_image is false when RETURN_FULL_IMAGE=false."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ,
-            {"GEMINI_API_KEY": "test-key", "RETURN_FULL_IMAGE": "false"},
-            clear=True,
-        ):
-            config = ServerConfig.from_env()
-            assert config.return_full_image is False
-
-    def test_env_var_1(self):
-        """return_full_image is true when RETURN_FULL_IMAGE=1."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ,
-            {"GEMINI_API_KEY": "test-key", "RETURN_FULL_IMAGE": "1"},
-            clear=True,
-        ):
-            config = ServerConfig.from_env()
-            assert config.return_full_image is True
-
-    def test_env_var_yes(self):
-        """return_full_image is true when RETURN_FULL_IMAGE=yes."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ,
-            {"GEMINI_API_KEY": "test-key", "RETURN_FULL_IMAGE": "yes"},
-            clear=True,
-        ):
-            config = ServerConfig.from_env()
-            assert config.return_full_image is True
-
-    def test_env_var_invalid(self):
-        """return_full_image is false for unrecognized values."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ,
-            {"GEMINI_API_KEY": "test-key", "RETURN_FULL_IMAGE": "maybe"},
-            clear=True,
-        ):
-            config = ServerConfig.from_env()
-            assert config.return_full_image is False
-
-    def test_env_var_case_insensitive(self):
-        """return_full_image parsing is case-insensitive."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ,
-            {"GEMINI_API_KEY": "test-key", "RETURN_FULL_IMAGE": "TRUE"},
-            clear=True,
-        ):
-            config = ServerConfig.from_env()
-            assert config.return_full_image is True
-
-    def test_env_var_with_whitespace(self):
-        """return_full_image handles whitespace in env var value."""
-        with patch("nanobanana_mcp_server.config.settings.load_dotenv"), patch.dict(
-            os.environ,
-            {"GEMINI_API_KEY": "test-key", "RETURN_FULL_IMAGE": " true "},
-            clear=True,
-        ):
-            config = ServerConfig.from_env()
-            assert config.return_full_image is True
+            assert config.return_full_image is expected
 
 
 class TestReturnFullImageToolParameter:
     """Test return_full_image parameter in generate_image tool schema."""
 
-    def test_parameter_exists_in_schema(self):
+    def test_parameter_exists_in_schema(self, generate_image_tool_params):
         """Verify return_full_image exists in tool JSON schema properties."""
-        from fastmcp import FastMCP
-
-        from nanobanana_mcp_server.tools.generate_image import register_generate_image_tool
-
-        server = FastMCP("test")
-        register_generate_image_tool(server)
-
-        tools = list(server._tool_manager._tools.values())
-        assert len(tools) > 0
-        tool = tools[0]
-        properties = tool.parameters.get("properties", {})
+        properties = generate_image_tool_params.get("properties", {})
         assert "return_full_image" in properties
 
-    def test_parameter_not_required(self):
+    def test_parameter_not_required(self, generate_image_tool_params):
         """Verify return_full_image is not in required params (defaults to None)."""
-        from fastmcp import FastMCP
-
-        from nanobanana_mcp_server.tools.generate_image import register_generate_image_tool
-
-        server = FastMCP("test")
-        register_generate_image_tool(server)
-
-        tools = list(server._tool_manager._tools.values())
-        assert len(tools) > 0
-        tool = tools[0]
-        required = tool.parameters.get("required", [])
+        required = generate_image_tool_params.get("required", [])
         assert "return_full_image" not in required
 
 
@@ -182,8 +126,7 @@ class TestReturnFullImagePriority:
             if effective is None:
                 # Simulate RuntimeError from get_server_config
                 effective = (
-                    os.getenv("RETURN_FULL_IMAGE", "false").strip().lower()
-                    in ("true", "1", "yes")
+                    os.getenv("RETURN_FULL_IMAGE", "false").strip().lower() in TRUTHY_ENV_VALUES
                 )
             assert effective is True
 
@@ -193,8 +136,7 @@ class TestReturnFullImagePriority:
             effective = None
             if effective is None:
                 effective = (
-                    os.getenv("RETURN_FULL_IMAGE", "false").strip().lower()
-                    in ("true", "1", "yes")
+                    os.getenv("RETURN_FULL_IMAGE", "false").strip().lower() in TRUTHY_ENV_VALUES
                 )
             assert effective is False
 
@@ -202,20 +144,14 @@ class TestReturnFullImagePriority:
 class TestReturnFullImageReplacement:
     """Test full-image replacement logic."""
 
-    def test_mcpimage_path_creates_valid_image(self):
+    def test_mcpimage_path_creates_valid_image(self, tmp_path):
         """MCPImage(path=) creates a valid Image object from a file."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
-            f.flush()
-            try:
-                img = MCPImage(path=f.name)
-                assert img is not None
-            finally:
-                os.unlink(f.name)
-
-    def test_fallback_to_thumbnail_when_file_missing(self):
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+        assert MCPImage(path=str(image_path)) is not None
+
+    def test_fallback_to_thumbnail_when_file_missing(self, thumbnail):
         """When full_path doesn't exist, thumbnail should be used."""
-        thumbnail = MCPImage(data=b"\xff\xd8\xff\xe0" + b"\x00" * 50, format="jpeg")
         metadata = [{"full_path": "/nonexistent/image.png", "size_bytes": 1000}]
 
         full_images = []
@@ -230,9 +166,8 @@ class TestReturnFullImageReplacement:
         assert len(full_images) == 1
         assert full_images[0] is thumbnail
 
-    def test_fallback_when_full_path_missing_from_metadata(self):
+    def test_fallback_when_full_path_missing_from_metadata(self, thumbnail):
         """When metadata has no full_path key, thumbnail should be used."""
-        thumbnail = MCPImage(data=b"\xff\xd8\xff\xe0" + b"\x00" * 50, format="jpeg")
         metadata = [{"size_bytes": 1000}]  # no full_path
 
         full_images = []
@@ -247,11 +182,9 @@ class TestReturnFullImageReplacement:
         assert len(full_images) == 1
         assert full_images[0] is thumbnail
 
-    def test_metadata_filtering_keeps_alignment(self):
+    def test_metadata_filtering_keeps_alignment(self, thumbs_abc):
         """Filtering metadata should keep thumbnail_images aligned."""
-        thumb_a = MCPImage(data=b"\xff\xd8\xff\xe0" + b"\x00" * 10, format="jpeg")
-        thumb_b = MCPImage(data=b"\xff\xd8\xff\xe0" + b"\x00" * 20, format="jpeg")
-        thumb_c = MCPImage(data=b"\xff\xd8\xff\xe0" + b"\x00" * 30, format="jpeg")
+        thumb_a, thumb_b, thumb_c = thumbs_abc
 
         # Metadata has a None entry in the middle
         metadata = [
@@ -261,19 +194,7 @@ class TestReturnFullImageReplacement:
         ]
         thumbnail_images = [thumb_a, thumb_b, thumb_c]
 
-        # Apply the same filtering logic as generate_image.py
-        filtered_pairs = [
-            (m, thumbnail_images[i] if i < len(thumbnail_images) else None)
-            for i, m in enumerate(metadata)
-            if m is not None and isinstance(m, dict)
-        ]
-        if filtered_pairs:
-            filtered_meta, filtered_thumbs = zip(*filtered_pairs, strict=False)
-            filtered_meta = list(filtered_meta)
-            filtered_thumbs = [img for img in filtered_thumbs if img is not None]
-        else:
-            filtered_meta = []
-            filtered_thumbs = []
+        filtered_meta, filtered_thumbs = _filter_metadata(metadata, thumbnail_images)
 
         # Should have 2 entries: first and third (None removed)
         assert len(filtered_meta) == 2
@@ -283,10 +204,9 @@ class TestReturnFullImageReplacement:
         assert filtered_thumbs[0] is thumb_a
         assert filtered_thumbs[1] is thumb_c
 
-    def test_all_metadata_valid_no_filtering(self):
+    def test_all_metadata_valid_no_filtering(self, thumbs_abc):
         """When all metadata is valid, filtering keeps everything intact."""
-        thumb_a = MCPImage(data=b"\xff\xd8\xff\xe0" + b"\x00" * 10, format="jpeg")
-        thumb_b = MCPImage(data=b"\xff\xd8\xff\xe0" + b"\x00" * 20, format="jpeg")
+        thumb_a, thumb_b, _ = thumbs_abc
 
         metadata = [
             {"full_path": "/a.png", "size_bytes": 100},
@@ -294,16 +214,46 @@ class TestReturnFullImageReplacement:
         ]
         thumbnail_images = [thumb_a, thumb_b]
 
-        filtered_pairs = [
-            (m, thumbnail_images[i] if i < len(thumbnail_images) else None)
-            for i, m in enumerate(metadata)
-            if m is not None and isinstance(m, dict)
-        ]
-        filtered_meta, filtered_thumbs = zip(*filtered_pairs, strict=False)
-        filtered_meta = list(filtered_meta)
-        filtered_thumbs = [img for img in filtered_thumbs if img is not None]
+        filtered_meta, filtered_thumbs = _filter_metadata(metadata, thumbnail_images)
 
         assert len(filtered_meta) == 2
         assert len(filtered_thumbs) == 2
         assert filtered_thumbs[0] is thumb_a
         assert filtered_thumbs[1] is thumb_b
+
+    def test_all_metadata_invalid(self, thumbnail):
+        """When every metadata entry is invalid, both lists come back empty."""
+        filtered_meta, filtered_thumbs = _filter_metadata([None, "bad"], [thumbnail, thumbnail])
+
+        assert filtered_meta == []
+        assert filtered_thumbs == []
+
+
+class TestInlineThumbnails:
+    """Test the inline_thumbnails parameter and resource link construction."""
+
+    def test_parameter_defaults_to_inline(self, generate_image_tool_params):
+        schema = generate_image_tool_params["properties"]["inline_thumbnails"]
+        assert schema["default"] is True
+        assert "inline_thumbnails" not in generate_image_tool_params.get("required", [])
+
+    def test_links_point_at_saved_files(self, tmp_path):
+        image_path = tmp_path / "cat.png"
+        metadata = [{"full_path": str(image_path), "size_bytes": 1234}]
+
+        (link,) = _resource_links(metadata)
+
+        assert str(link.uri) == image_path.as_uri()
+        assert link.name == "cat.png"
+        assert link.mimeType == "image/png"
+        assert link.size == 1234
+
+    def test_metadata_mime_type_wins_over_extension(self, tmp_path):
+        metadata = [{"full_path": str(tmp_path / "shot.png"), "mime_type": "image/jpeg"}]
+
+        (link,) = _resource_links(metadata)
+
+        assert link.mimeType == "image/jpeg"
+
+    def test_entries_without_path_are_skipped(self):
+        assert _resource_links([{"size_bytes": 10}]) == []
@@ -0,0 +1,44 @@
+"""
+Tests for core input validation helpers.
+"""
+
+import base64
+
+import pytest
+
+from nanobanana_mcp_server.core.exceptions import ValidationError
+from nanobanana_mcp_server.core.validation import validate_base64_image
+
+pytestmark = pytest.mark.unit
+
+
+class TestValidateBase64Image:
+    @pytest.mark.parametrize(
+        "payload", [b"\x89PNG\r\n\x1a\n", b"a", b"ab", b"abc", bytes(range(256))]
+    )
+    def test_accepts_encoded_bytes(self, payload):
+        validate_base64_image(base64.b64encode(payload).decode())
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "abc",  # length not a multiple of 4
+            "ab c",  # whitespace
+            "ab-_",  # urlsafe alphabet
+            "a===",  # too much padding
+            "ab=c",  # padding in the middle
+            "YWJjéA==",  # non-ASCII
+        ],
+    )
+    def test_rejects_invalid(self, value):
+        with pytest.raises(ValidationError):
+            validate_base64_image(value)
+
+    @pytest.mark.parametrize("value", ["abc", "ab c", "ab-_", "a===", "ab=c"])
+    def test_agrees_with_strict_decode(self, value):
+        """Values rejected by the fast check are ones a strict decode rejects too."""
+        with pytest.raises(ValidationError):
+            validate_base64_image(value)
+        with pytest.raises(ValueError):
+            base64.b64decode(value, validate=True)